@@ -7,24 +7,117 @@ and generates a comprehensive changelog.
 """
 
 import argparse
+import asyncio
+import hashlib
+import json
+import os
 import re
+import sqlite3
 import sys
-from datetime import datetime
-from typing import Tuple
+import time
+from collections import defaultdict, namedtuple
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+
+API_URL = "https://api.github.com"
+
+_VERSION_RE = re.compile(r"v?(\d+)\.(\d+)\.(\d+)")
+
+# Default lifetime of cached GraphQL pages that carry no ETag to revalidate
+DEFAULT_CACHE_TTL = 600
+
+# One search per request, paginated 100 nodes at a time
+SEARCH_QUERY = """
+query($query: String!, $cursor: String) {
+  search(query: $query, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on Issue {
+        number title url author { login } labels(first: 20) { nodes { name } }
+      }
+      ... on PullRequest {
+        number title url author { login } labels(first: 20) { nodes { name } }
+      }
+    }
+  }
+}
+"""
 
-try:
-    from github import Github
-except ImportError:
-    print("PyGithub is required. Install with: pip install PyGithub")
-    sys.exit(1)
+# Label buckets, checked in order before falling back to the title
+BUG_LABELS = frozenset({"bug", "fix"})
+FEATURE_LABELS = frozenset({"enhancement", "feature", "new-feature"})
+BREAKING_LABELS = frozenset({"breaking-change", "breaking"})
+DOCUMENTATION_LABELS = frozenset({"documentation", "docs"})
+PERFORMANCE_LABELS = frozenset({"performance", "optimization"})
+SECURITY_LABELS = frozenset({"security"})
+
+LABEL_CATEGORIES = (
+    ("bug", BUG_LABELS),
+    ("feature", FEATURE_LABELS),
+    ("breaking", BREAKING_LABELS),
+    ("documentation", DOCUMENTATION_LABELS),
+    ("performance", PERFORMANCE_LABELS),
+    ("security", SECURITY_LABELS),
+)
+
+# Title keywords match anywhere in the title (e.g. "doc" in "docstring")
+BUG_TITLE_RE = re.compile(r"fix|bug|issue|error|crash", re.IGNORECASE)
+FEATURE_TITLE_RE = re.compile(r"add|new|feature|support|implement", re.IGNORECASE)
+DOCUMENTATION_TITLE_RE = re.compile(r"doc|readme|guide", re.IGNORECASE)
+PERFORMANCE_TITLE_RE = re.compile(r"performance|speed|optimize", re.IGNORECASE)
+SECURITY_TITLE_RE = re.compile(r"security|vulnerability", re.IGNORECASE)
+
+TITLE_CATEGORIES = (
+    ("bug", BUG_TITLE_RE),
+    ("feature", FEATURE_TITLE_RE),
+    ("documentation", DOCUMENTATION_TITLE_RE),
+    ("performance", PERFORMANCE_TITLE_RE),
+    ("security", SECURITY_TITLE_RE),
+)
+
+EMOJI = {
+    "bug": "🐛",
+    "feature": "✨",
+    "breaking": "💥",
+    "documentation": "📚",
+    "performance": "⚡",
+    "security": "🔒",
+    "other": "🔧",
+}
+
+# Changelog sections, in the order they appear. Issue categories without
+# a section of their own are listed under "other".
+PR_SECTIONS = [
+    ("breaking", "💥 Breaking Changes"),
+    ("feature", "✨ New Features"),
+    ("bug", "🐛 Bug Fixes"),
+    ("performance", "⚡ Performance Improvements"),
+    ("documentation", "📚 Documentation"),
+    ("security", "🔒 Security"),
+    ("other", "🔧 Other Changes"),
+]
+ISSUE_SECTIONS = [
+    ("bug", "🐛 Bug Reports"),
+    ("feature", "✨ Feature Requests"),
+    ("documentation", "📚 Documentation"),
+    ("other", "🔧 Other Issues"),
+]
+
+# Lightweight issue/PR records consumed by the formatters
+Label = namedtuple("Label", ["name"])
+User = namedtuple("User", ["login"])
+Item = namedtuple("Item", ["number", "title", "html_url", "user", "labels"])
 
 
 def parse_version(version: str) -> Tuple[int, int, int]:
     """Parse version string into major, minor, patch components."""
-    match = re.match(r"v?(\d+)\.(\d+)\.(\d+)", version)
+    match = _VERSION_RE.fullmatch(version)
     if not match:
         raise ValueError(f"Invalid version format: {version}")
-    return tuple(map(int, match.groups()))
+    return tuple(int(part) for part in match.groups())
 
 
 def get_previous_minor_version(major: int, minor: int) -> str:
@@ -35,108 +128,37 @@ def get_previous_minor_version(major: int, minor: int) -> str:
     return f"v{major}.{minor - 1}.0"
 
 
-def categorize_issue(issue) -> str:
-    """Categorize an issue based on labels and title."""
-    labels = [label.name.lower() for label in issue.labels]
+def _categorize(item) -> str:
+    """Categorize an issue or pull request based on labels and title."""
+    labels = {label.name.lower() for label in item.labels}
 
     # Check for specific labels first
-    if any(label in labels for label in ["bug", "fix"]):
-        return "bug"
-    elif any(label in labels for label in ["enhancement", "feature", "new-feature"]):
-        return "feature"
-    elif any(label in labels for label in ["breaking-change", "breaking"]):
-        return "breaking"
-    elif any(label in labels for label in ["documentation", "docs"]):
-        return "documentation"
-    elif any(label in labels for label in ["performance", "optimization"]):
-        return "performance"
-    elif any(label in labels for label in ["security"]):
-        return "security"
+    for category, category_labels in LABEL_CATEGORIES:
+        if labels & category_labels:
+            return category
 
     # Fallback to title analysis
-    title_lower = issue.title.lower()
-    if any(word in title_lower for word in ["fix", "bug", "issue", "error", "crash"]):
-        return "bug"
-    elif any(
-        word in title_lower
-        for word in ["add", "new", "feature", "support", "implement"]
-    ):
-        return "feature"
-    elif any(word in title_lower for word in ["doc", "readme", "guide"]):
-        return "documentation"
-    elif any(word in title_lower for word in ["performance", "speed", "optimize"]):
-        return "performance"
-    elif any(word in title_lower for word in ["security", "vulnerability"]):
-        return "security"
+    for category, pattern in TITLE_CATEGORIES:
+        if pattern.search(item.title):
+            return category
 
     return "other"
 
 
-def categorize_pr(pr) -> str:
-    """Categorize a pull request based on labels and title."""
-    labels = [label.name.lower() for label in pr.labels]
-
-    # Check for specific labels first
-    if any(label in labels for label in ["bug", "fix"]):
-        return "bug"
-    elif any(label in labels for label in ["enhancement", "feature", "new-feature"]):
-        return "feature"
-    elif any(label in labels for label in ["breaking-change", "breaking"]):
-        return "breaking"
-    elif any(label in labels for label in ["documentation", "docs"]):
-        return "documentation"
-    elif any(label in labels for label in ["performance", "optimization"]):
-        return "performance"
-    elif any(label in labels for label in ["security"]):
-        return "security"
-
-    # Fallback to title analysis
-    title_lower = pr.title.lower()
-    if any(word in title_lower for word in ["fix", "bug", "issue", "error", "crash"]):
-        return "bug"
-    elif any(
-        word in title_lower
-        for word in ["add", "new", "feature", "support", "implement"]
-    ):
-        return "feature"
-    elif any(word in title_lower for word in ["doc", "readme", "guide"]):
-        return "documentation"
-    elif any(word in title_lower for word in ["performance", "speed", "optimize"]):
-        return "performance"
-    elif any(word in title_lower for word in ["security", "vulnerability"]):
-        return "security"
+categorize_issue = _categorize
+categorize_pr = _categorize
 
-    return "other"
 
-
-def format_issue_entry(issue) -> str:
+def format_issue_entry(issue, category: str) -> str:
     """Format an issue entry for the changelog."""
-    category = categorize_issue(issue)
-    emoji = {
-        "bug": "🐛",
-        "feature": "✨",
-        "breaking": "💥",
-        "documentation": "📚",
-        "performance": "⚡",
-        "security": "🔒",
-        "other": "🔧",
-    }.get(category, "🔧")
+    emoji = EMOJI.get(category, "🔧")
 
     return f"- {emoji} **{issue.title}** ([#{issue.number}]({issue.html_url}))"
 
 
-def format_pr_entry(pr) -> str:
+def format_pr_entry(pr, category: str) -> str:
     """Format a pull request entry for the changelog."""
-    category = categorize_pr(pr)
-    emoji = {
-        "bug": "🐛",
-        "feature": "✨",
-        "breaking": "💥",
-        "documentation": "📚",
-        "performance": "⚡",
-        "security": "🔒",
-        "other": "🔧",
-    }.get(category, "🔧")
+    emoji = EMOJI.get(category, "🔧")
 
     # Add contributor info
     contributor = f"by @{pr.user.login}" if pr.user else ""
@@ -144,13 +166,196 @@ def format_pr_entry(pr) -> str:
     return f"- {emoji} **{pr.title}** ([#{pr.number}]({pr.html_url})) {contributor}"
 
 
-def generate_changelog(
-    github_token: str, repo_name: str, version: str, output_file: str
-):
-    """Generate changelog for the specified version."""
-    g = Github(github_token)
-    repo = g.get_repo(repo_name)
+def _categorize_and_format(item, formatter) -> Tuple[str, str]:
+    """Categorize an issue or PR and format its entry in a single pass."""
+    category = _categorize(item)
+    return category, formatter(item, category)
+
+
+def _make_client(token: str) -> "httpx.AsyncClient":
+    """Create the single keep-alive HTTP/2 session used for all API calls."""
+    # Imported lazily so that --help does not pay for the HTTP stack
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            'httpx is required. Install with: pip install "httpx[http2]"'
+        ) from e
+
+    return httpx.AsyncClient(
+        base_url=API_URL,
+        headers={"Authorization": f"bearer {token}"},
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=30,
+    )
+
+
+class ResponseCache:
+    """On-disk cache of GitHub API responses keyed by request.
+
+    REST responses are revalidated with ``If-None-Match``; a 304 reply is
+    served from the cache and does not count against the rate limit.
+    GitHub's GraphQL endpoint is POST-only and rarely returns an ETag, so
+    GraphQL pages without one are reused while younger than ``ttl`` seconds.
+    """
+
+    def __init__(self, path: str, ttl: int = DEFAULT_CACHE_TTL):
+        self.ttl = ttl
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, etag TEXT, body TEXT, fetched_at REAL)"
+        )
+
+    @staticmethod
+    def key(method: str, url: str, payload: Optional[Dict] = None) -> str:
+        """Hash a request into a stable cache key."""
+        raw = json.dumps([method, url, payload], sort_keys=True).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Optional[str], Dict, float]]:
+        """Return ``(etag, body, fetched_at)`` for a key, if cached."""
+        row = self._db.execute(
+            "SELECT etag, body, fetched_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), row[2]
+
+    def put(self, key: str, etag: Optional[str], body: Dict):
+        """Store a response body and its ETag."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (key, etag, json.dumps(body), time.time()),
+        )
+        self._db.commit()
+
+    def close(self):
+        """Close the underlying database."""
+        self._db.close()
+
+
+async def _request(
+    client: "httpx.AsyncClient",
+    cache: Optional[ResponseCache],
+    method: str,
+    url: str,
+    payload: Optional[Dict] = None,
+) -> Dict:
+    """Send an API request, serving it from the cache when still valid."""
+    key = cached = None
+    headers = {}
+    if cache is not None:
+        key = cache.key(method, url, payload)
+        cached = cache.get(key)
+        if cached is not None:
+            etag, body, fetched_at = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            elif method == "POST" and time.time() - fetched_at < cache.ttl:
+                return body
+
+    response = await client.request(method, url, json=payload, headers=headers)
+    if response.status_code == 304 and cached is not None:
+        return cached[1]
+    response.raise_for_status()
+    body = response.json()
+    if cache is not None:
+        cache.put(key, response.headers.get("ETag"), body)
+    return body
+
+
+async def _graphql(
+    client: "httpx.AsyncClient",
+    cache: Optional[ResponseCache],
+    query: str,
+    variables: Dict,
+) -> Dict:
+    """Run a GraphQL query against the GitHub API and return its data."""
+    payload = await _request(
+        client, cache, "POST", "/graphql", {"query": query, "variables": variables}
+    )
+    if payload.get("errors"):
+        raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+    return payload["data"]
+
+
+def _to_item(node: Dict) -> Item:
+    """Convert a GraphQL issue/PR node into a lightweight changelog item."""
+    author = node.get("author")
+    return Item(
+        number=node["number"],
+        title=node["title"],
+        html_url=node["url"],
+        user=User(author["login"]) if author else None,
+        labels=[Label(label["name"]) for label in node["labels"]["nodes"]],
+    )
+
 
+async def _fetch_all(
+    client: "httpx.AsyncClient", cache: Optional[ResponseCache], query: str
+) -> List[Item]:
+    """Fetch every issue or PR matching a search query, page by page."""
+    items: List[Item] = []
+    cursor: Optional[str] = None
+    while True:
+        data = await _graphql(
+            client, cache, SEARCH_QUERY, {"query": query, "cursor": cursor}
+        )
+        result = data["search"]
+        items.extend(_to_item(node) for node in result["nodes"] if node)
+        if not result["pageInfo"]["hasNextPage"]:
+            return items
+        cursor = result["pageInfo"]["endCursor"]
+
+
+async def _resolve_since_date(
+    client: "httpx.AsyncClient",
+    cache: Optional[ResponseCache],
+    repo_name: str,
+    previous_tag: Optional[str],
+) -> Optional[str]:
+    """Resolve the ISO timestamp of the previous release or tag, if any."""
+    if not previous_tag:
+        return None
+    try:
+        release = await _request(
+            client, cache, "GET", f"/repos/{repo_name}/releases/tags/{previous_tag}"
+        )
+        return release["created_at"]
+    except Exception:
+        # If release doesn't exist, try to find the tag
+        try:
+            ref = await _request(
+                client, cache, "GET", f"/repos/{repo_name}/git/ref/tags/{previous_tag}"
+            )
+            commit = await _request(
+                client,
+                cache,
+                "GET",
+                f"/repos/{repo_name}/commits/{ref['object']['sha']}",
+            )
+            return commit["commit"]["author"]["date"]
+        except Exception as e:
+            print(f"Error: {e}")
+            print(f"Warning: Could not find {previous_tag}, using all issues/PRs")
+            return None
+
+
+async def generate_changelog(
+    github_token: str,
+    repo_name: str,
+    version: str,
+    cache: Optional[ResponseCache] = None,
+) -> Tuple[str, Dict[str, List[str]], Dict[str, List[str]]]:
+    """Fetch and categorize the changes for the specified version.
+
+    Pass a ``ResponseCache`` to reuse GitHub responses across runs.
+
+    Returns the version tag and the PR and issue entries by category, for
+    ``write_changelog``.
+    """
     # Parse version
     major, minor, patch = parse_version(version)
     current_tag = f"v{version}" if not version.startswith("v") else version
@@ -164,155 +369,83 @@ def generate_changelog(
     else:
         print("Since repository creation")
 
-    # Get issues and PRs since the previous version
-    since_date = None
-    if previous_tag:
-        try:
-            previous_release = repo.get_release(previous_tag)
-            since_date = previous_release.created_at
-        except Exception:
-            # If release doesn't exist, try to find the tag
-            try:
-                tag = repo.get_git_ref(f"tags/{previous_tag}")
-                commit = repo.get_commit(tag.object.sha)
-                since_date = commit.commit.author.date
-            except Exception as e:
-                print(f"Error: {e}")
-                print(f"Warning: Could not find {previous_tag}, using all issues/PRs")
-
-    # Collect issues and PRs
-    issues = []
-    pull_requests = []
-
-    # Get issues
-    query = f"repo:{repo_name} is:issue is:closed"
-    if since_date:
-        query += f" closed:>={since_date.isoformat()}"
-
-    for issue in g.search_issues(query=query, sort="created", order="desc"):
-        if issue.pull_request:  # Skip PRs in issue search
-            continue
-        issues.append(issue)
-
-    # Get pull requests
-    query = f"repo:{repo_name} is:pr is:merged"
-    if since_date:
-        query += f" merged:>={since_date.isoformat()}"
-
-    for pr in g.search_issues(query=query, sort="created", order="desc"):
-        pull_requests.append(pr.as_pull_request())
+    async with _make_client(github_token) as client:
+        # Get issues and PRs since the previous version
+        since_date = await _resolve_since_date(client, cache, repo_name, previous_tag)
+
+        issue_query = f"repo:{repo_name} is:issue is:closed sort:created-desc"
+        pr_query = f"repo:{repo_name} is:pr is:merged sort:created-desc"
+        if since_date:
+            issue_query += f" closed:>={since_date}"
+            pr_query += f" merged:>={since_date}"
+
+        issues, pull_requests = await asyncio.gather(
+            _fetch_all(client, cache, issue_query), _fetch_all(client, cache, pr_query)
+        )
 
     # Categorize and organize
-    categorized_issues = {}
-    categorized_prs = {}
+    categorized_issues = defaultdict(list)
+    categorized_prs = defaultdict(list)
 
     for issue in issues:
-        category = categorize_issue(issue)
-        if category not in categorized_issues:
-            categorized_issues[category] = []
-        categorized_issues[category].append(issue)
+        category, entry = _categorize_and_format(issue, format_issue_entry)
+        categorized_issues[category].append(entry)
 
     for pr in pull_requests:
-        category = categorize_pr(pr)
-        if category not in categorized_prs:
-            categorized_prs[category] = []
-        categorized_prs[category].append(pr)
-
-    # Generate changelog content
-    changelog = []
-    changelog.append(f"# Changelog for {current_tag}")
-    changelog.append("")
-    changelog.append(f"*Released on {datetime.now().strftime('%Y-%m-%d')}*")
-    changelog.append("")
-
-    # Breaking changes
-    if "breaking" in categorized_prs:
-        changelog.append("## 💥 Breaking Changes")
-        changelog.append("")
-        for pr in categorized_prs["breaking"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Features
-    if "feature" in categorized_prs:
-        changelog.append("## ✨ New Features")
-        changelog.append("")
-        for pr in categorized_prs["feature"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Bug fixes
-    if "bug" in categorized_prs:
-        changelog.append("## 🐛 Bug Fixes")
-        changelog.append("")
-        for pr in categorized_prs["bug"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Performance improvements
-    if "performance" in categorized_prs:
-        changelog.append("## ⚡ Performance Improvements")
-        changelog.append("")
-        for pr in categorized_prs["performance"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Documentation
-    if "documentation" in categorized_prs:
-        changelog.append("## 📚 Documentation")
-        changelog.append("")
-        for pr in categorized_prs["documentation"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Security
-    if "security" in categorized_prs:
-        changelog.append("## 🔒 Security")
-        changelog.append("")
-        for pr in categorized_prs["security"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Other changes
-    if "other" in categorized_prs:
-        changelog.append("## 🔧 Other Changes")
-        changelog.append("")
-        for pr in categorized_prs["other"]:
-            changelog.append(format_pr_entry(pr))
-        changelog.append("")
-
-    # Issues (non-PRs)
-    if any(categorized_issues.values()):
-        changelog.append("## 📋 Issues")
-        changelog.append("")
-        for category, issues_list in categorized_issues.items():
-            if category == "bug":
-                changelog.append("### 🐛 Bug Reports")
-            elif category == "feature":
-                changelog.append("### ✨ Feature Requests")
-            elif category == "documentation":
-                changelog.append("### 📚 Documentation")
-            else:
-                changelog.append("### 🔧 Other Issues")
-            changelog.append("")
-            for issue in issues_list:
-                changelog.append(format_issue_entry(issue))
-            changelog.append("")
-
-    # Statistics
-    total_prs = sum(len(prs) for prs in categorized_prs.values())
-    total_issues = sum(len(issues) for issues in categorized_issues.values())
-
-    changelog.append("## 📊 Statistics")
-    changelog.append("")
-    changelog.append(f"- **Pull Requests**: {total_prs}")
-    changelog.append(f"- **Issues**: {total_issues}")
-    changelog.append(f"- **Total Changes**: {total_prs + total_issues}")
-    changelog.append("")
-
-    # Write to file
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write("\n".join(changelog))
+        category, entry = _categorize_and_format(pr, format_pr_entry)
+        categorized_prs[category].append(entry)
+
+    return current_tag, categorized_prs, categorized_issues
+
+
+def write_changelog(
+    output_file: str,
+    current_tag: str,
+    categorized_prs: Dict[str, List[str]],
+    categorized_issues: Dict[str, List[str]],
+):
+    """Write the changelog, one section per write.
+
+    Only a single section is held in memory at a time.
+    """
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(
+            f"# Changelog for {current_tag}\n\n"
+            f"*Released on {datetime.now(timezone.utc).date().isoformat()}*\n\n"
+        )
+
+        for key, title in PR_SECTIONS:
+            items = categorized_prs.get(key)
+            if not items:
+                continue
+            entries = "\n".join(items)
+            f.write(f"## {title}\n\n{entries}\n\n")
+
+        # Issues (non-PRs)
+        if any(categorized_issues.values()):
+            f.write("## 📋 Issues\n\n")
+            issue_sections = {key: [] for key, _ in ISSUE_SECTIONS}
+            for category, issues_list in categorized_issues.items():
+                issue_sections.get(category, issue_sections["other"]).extend(
+                    issues_list
+                )
+            for key, title in ISSUE_SECTIONS:
+                items = issue_sections[key]
+                if not items:
+                    continue
+                entries = "\n".join(items)
+                f.write(f"### {title}\n\n{entries}\n\n")
+
+        # Statistics
+        total_prs = sum(len(prs) for prs in categorized_prs.values())
+        total_issues = sum(len(issues) for issues in categorized_issues.values())
+
+        f.write(
+            "## 📊 Statistics\n\n"
+            f"- **Pull Requests**: {total_prs}\n"
+            f"- **Issues**: {total_issues}\n"
+            f"- **Total Changes**: {total_prs + total_issues}\n"
+        )
 
     print(f"Changelog written to {output_file}")
     print(f"Total PRs: {total_prs}, Total Issues: {total_issues}")
@@ -328,6 +461,15 @@ def main():
     parser.add_argument("--repo", required=True, help="GitHub repository (owner/repo)")
     parser.add_argument("--output", default="CHANGELOG.md", help="Output file path")
     parser.add_argument("--token", help="GitHub token (or use GITHUB_TOKEN env var)")
+    parser.add_argument(
+        "--cache", help="SQLite file for caching GitHub responses across runs"
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help="Seconds to reuse cached search pages that have no ETag",
+    )
 
     args = parser.parse_args()
 
@@ -339,14 +481,17 @@ def main():
         )
         sys.exit(1)
 
+    cache = ResponseCache(args.cache, args.cache_ttl) if args.cache else None
     try:
-        generate_changelog(token, args.repo, args.version, args.output)
+        changes = asyncio.run(generate_changelog(token, args.repo, args.version, cache))
+        write_changelog(args.output, *changes)
     except Exception as e:
         print(f"Error generating changelog: {e}")
         sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
-    import os
-
     main()
@@ -25,6 +25,8 @@ if __name__ == "__main__":
                 "vincentgregoire/daflip",
                 "--output",
                 "docs/changelog.md",
+                "--cache",
+                ".daflip_ghcache.sqlite",
             ]
         )
 
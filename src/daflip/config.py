@@ -5,20 +5,27 @@ This module handles configuration loading from environment variables
 and provides a centralized configuration interface for the daflip package.
 """
 
+import functools
 import os
+from types import MappingProxyType
+from typing import Mapping
 
 from dotenv import load_dotenv
 
 
-def get_config() -> dict:
+@functools.lru_cache(maxsize=1)
+def get_config() -> Mapping[str, str]:
     """Load configuration from environment variables.
 
     This function loads configuration settings from environment variables,
     with support for .env files. It provides default values for required
     configuration keys.
 
+    The result is computed once per process, so the .env file is only parsed
+    on the first call. Use ``get_config.cache_clear()`` to force a reload.
+
     Returns:
-        dict: Configuration dictionary with loaded settings
+        Mapping[str, str]: Read-only configuration mapping with loaded settings
 
     Environment Variables:
         DAFLIP_LOG_LEVEL: Logging level (default: "INFO")
@@ -31,11 +38,11 @@ def get_config() -> dict:
     load_dotenv()
 
     # Get environment variables with proper handling of empty values
-    log_level = os.getenv("DAFLIP_LOG_LEVEL")
-    if not log_level or log_level.strip() == "":
-        log_level = "INFO"
-
-    return {
-        # Add config keys as needed
-        "LOG_LEVEL": log_level,
-    }
+    log_level = (os.getenv("DAFLIP_LOG_LEVEL") or "").strip() or "INFO"
+
+    return MappingProxyType(
+        {
+            # Add config keys as needed
+            "LOG_LEVEL": log_level,
+        }
+    )
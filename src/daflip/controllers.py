@@ -10,7 +10,6 @@ import typer
 from rich.console import Console
 
 from .config import get_config
-from .services import convert_data
 
 console = Console()
 
@@ -23,13 +22,17 @@ def convert(
     compression: str = typer.Option(None, help="Compression type (optional)"),
     compression_level: int = typer.Option(None, help="Compression level (optional)"),
     rows: str = typer.Option(None, help="Row selection (e.g., 0:100)"),
+    columns: str = typer.Option(
+        None, help="Comma-separated columns to keep (e.g., id,name)"
+    ),
     sheet_name: str = typer.Option(None, help="Excel sheet name (optional)"),
     table_number: int = typer.Option(None, help="HTML table number (optional)"),
     sas_keep_bytes: bool = typer.Option(
         False, help="Keep SAS string columns as bytes (default: convert to string)"
     ),
     input_chunk_size: int = typer.Option(
-        None, help="Number of rows per chunk to read (default: all at once)"
+        None,
+        help="Number of rows per chunk to read, 0 to auto-size (default: all at once)",
     ),
     output_chunk_size: int = typer.Option(
         None, help="Number of rows per chunk to write (default: all at once)"
@@ -47,6 +50,7 @@ def convert(
     - Format overrides for input and output
     - Compression settings for output files
     - Row selection for partial data conversion
+    - Column selection for partial data conversion
     - Sheet selection for Excel files
     - Table selection for HTML files
     - Chunked processing for large files
@@ -60,6 +64,7 @@ def convert(
         compression: Compression type (e.g., "gzip", "snappy")
         compression_level: Compression level (1-9 for gzip)
         rows: Row selection range (e.g., "0:100")
+        columns: Comma-separated list of columns to keep (e.g., "id,name")
         sheet_name: Excel sheet name
         table_number: HTML table number (0-indexed)
         sas_keep_bytes: Keep SAS data as bytes
@@ -72,6 +77,8 @@ def convert(
         $ daflip convert large.csv output.csv --input-chunk-size 10000
         $ daflip convert data.xlsx output.csv --sheet-name "Sheet1" --rows "0:100"
     """
+    from .services import convert_data
+
     try:
         config = get_config()
         convert_data(
@@ -82,6 +89,7 @@ def convert(
             compression=compression,
             compression_level=compression_level,
             rows=rows,
+            columns=[c.strip() for c in columns.split(",")] if columns else None,
             sheet_name=sheet_name,
             table_number=table_number,
             sas_keep_bytes=sas_keep_bytes,
@@ -6,41 +6,57 @@ using pandas and pyarrow. It supports both chunked and non-chunked processing
 for large datasets.
 """
 
+import contextlib
+import functools
 import json
-from typing import Dict, Optional
+import os
+import queue
+import re
+import shutil
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 from rich.console import Console
-from rich.table import Table
 
 from .models import SupportedInputFormat, SupportedOutputFormat
 from .utils import infer_format
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
 # Supported pandas read/write kwargs for each format
 READ_KWARGS = {
-    SupportedInputFormat.CSV.value: ["sep", "dtype_backend"],
-    SupportedInputFormat.TSV.value: ["sep", "dtype_backend"],
-    SupportedInputFormat.PSV.value: ["sep", "dtype_backend"],
-    SupportedInputFormat.FIXED.value: ["colspecs", "dtype_backend"],
-    SupportedInputFormat.PARQUET.value: ["dtype_backend"],
-    SupportedInputFormat.ORC.value: ["dtype_backend"],
-    SupportedInputFormat.FEATHER.value: ["dtype_backend"],
-    SupportedInputFormat.SAS.value: [],
-    SupportedInputFormat.STATA.value: [],
-    SupportedInputFormat.SPSS.value: [],
-    SupportedInputFormat.EXCEL.value: ["sheet_name", "dtype_backend"],
-    SupportedInputFormat.HTML.value: ["match", "header", "index_col"],
+    SupportedInputFormat.CSV.value: frozenset({"sep", "dtype_backend"}),
+    SupportedInputFormat.TSV.value: frozenset({"sep", "dtype_backend"}),
+    SupportedInputFormat.PSV.value: frozenset({"sep", "dtype_backend"}),
+    SupportedInputFormat.FIXED.value: frozenset({"colspecs", "dtype_backend"}),
+    SupportedInputFormat.PARQUET.value: frozenset({"dtype_backend"}),
+    SupportedInputFormat.ORC.value: frozenset({"dtype_backend"}),
+    SupportedInputFormat.FEATHER.value: frozenset({"dtype_backend"}),
+    SupportedInputFormat.SAS.value: frozenset(),
+    SupportedInputFormat.STATA.value: frozenset(),
+    SupportedInputFormat.SPSS.value: frozenset(),
+    SupportedInputFormat.EXCEL.value: frozenset({"sheet_name", "dtype_backend"}),
+    SupportedInputFormat.HTML.value: frozenset({"match", "header", "index_col"}),
 }
 
 WRITE_KWARGS = {
-    SupportedOutputFormat.CSV.value: ["sep", "compression", "index"],
-    SupportedOutputFormat.PARQUET.value: ["compression", "compression_level", "index"],
-    SupportedOutputFormat.ORC.value: ["compression", "index"],
-    SupportedOutputFormat.FEATHER.value: ["compression", "compression_level", "index"],
-    SupportedOutputFormat.EXCEL.value: ["sheet_name", "index"],
-    SupportedOutputFormat.STATA.value: ["compression", "index"],
+    SupportedOutputFormat.CSV.value: frozenset({"sep", "compression", "index"}),
+    SupportedOutputFormat.PARQUET.value: frozenset(
+        {"compression", "compression_level", "index"}
+    ),
+    SupportedOutputFormat.ORC.value: frozenset({"compression", "index"}),
+    SupportedOutputFormat.FEATHER.value: frozenset(
+        {"compression", "compression_level", "index"}
+    ),
+    SupportedOutputFormat.EXCEL.value: frozenset({"sheet_name", "index"}),
+    SupportedOutputFormat.STATA.value: frozenset({"compression", "index"}),
 }
 
 SEP_MAP = {
@@ -49,44 +65,123 @@ SEP_MAP = {
     "psv": "|",
 }
 
+# Time zone aware timestamp type names, as printed by pyarrow
+TIMESTAMP_TZ_TYPE = re.compile(r"timestamp\[(s|ms|us|ns), tz=(.+)\]")
+
+# Maximum number of columns rendered by _show_preview
+PREVIEW_MAX_COLUMNS = 20
+
 # Supported chunked formats
 CHUNKED_READ_FORMATS = {"csv", "sas7bdat"}
 CHUNKED_WRITE_FORMATS = {"csv", "parquet"}  # feather does not support append
 
+# Formats that are read/written as Arrow tables without a pandas round-trip
+ARROW_READ_FORMATS = {"csv", "tsv", "psv", "parquet", "orc", "feather"}
+ARROW_WRITE_FORMATS = {"parquet", "orc", "feather"}
+
+# Formats copied byte for byte when converted to themselves without changes
+PASSTHROUGH_FORMATS = {"parquet", "orc", "feather"}
+
+# Block size for the multithreaded Arrow CSV reader
+ARROW_CSV_BLOCK_SIZE = 8 << 20
+
+# Column position and inferred type in Arrow's CSV conversion errors
+CSV_CONVERSION_ERROR = re.compile(
+    r"In CSV column #(\d+): .*CSV conversion error to (\w+)"
+)
+
+# Read buffer for sequentially scanned inputs, and codecs detected by extension
+INPUT_BUFFER_SIZE = 8 << 20
+CODEC_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".zst": "zstd", ".lz4": "lz4"}
+
+# Auto-sized chunks (input_chunk_size=0) target an L2-cache-sized batch
+AUTO_CHUNK_TARGET_BYTES = 256 * 1024
+AUTO_CHUNK_MIN_ROWS = 1024
+AUTO_CHUNK_MAX_ROWS = 2**20
+AUTO_CHUNK_DEFAULT_ROWS = 8192  # used when the schema is not known up front
+
+# Number of chunks read ahead while the previous chunk is being written
+CHUNK_PREFETCH_DEPTH = 2
+
+# Rows per record batch when streaming Arrow inputs into a Parquet writer
+TRANSCODE_BATCH_SIZE = 64 * 1024
+
+# Parquet writer tuning
+PARQUET_WRITE_BATCH_SIZE = 8192
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+PARQUET_ROW_GROUP_TARGET_BYTES = 128 << 20
+PARQUET_MIN_ROW_GROUP_SIZE = 8192
+# Chunked conversions coalesce at most this many chunks per row group, so the
+# buffered data stays within a few times the requested input_chunk_size
+PARQUET_ROW_GROUP_MAX_CHUNKS = 4
+
+# Rows per record batch in Feather (Arrow IPC) output
+FEATHER_CHUNK_SIZE = 64 * 1024
+
 
 def _show_preview(df: pd.DataFrame, msg: str = "Data preview"):
     """Display a preview of the dataframe using rich tables.
 
+    Only the first 5 rows and PREVIEW_MAX_COLUMNS columns are rendered, and
+    cells are stringified in one vectorized pass. When columns are left out,
+    the title says how many are shown.
+
     Args:
         df: The dataframe to preview
         msg: The title message for the preview table
     """
+    from rich.table import Table
+
+    head = df.iloc[:5, :PREVIEW_MAX_COLUMNS]
+    hidden = df.shape[1] - head.shape[1]
+    if hidden:
+        msg = f"{msg} (first {head.shape[1]}/{df.shape[1]} columns)"
     table = Table(title=msg)
-    for col in df.columns:
+    for col in head.columns:
         table.add_column(str(col))
-    for _, row in df.head(5).iterrows():
-        table.add_row(*[str(x) for x in row])
+    for row in head.to_numpy(dtype=str):
+        table.add_row(*row)
     console.print(table)
 
 
-def _load_schema(schema_file: str):
-    """Load schema from JSON file.
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed.
 
     Args:
-        schema_file: Path to the JSON schema file
+        data: The UTF-8 encoded JSON document
 
     Returns:
-        pyarrow.Schema: The loaded schema object
+        The decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
-    Raises:
-        FileNotFoundError: If the schema file doesn't exist
-        json.JSONDecodeError: If the schema file contains invalid JSON
-        ValueError: If the schema structure is invalid
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a value to indented JSON bytes, using orjson when installed.
+
+    Args:
+        obj: The JSON-serializable value
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document, indented by 2 spaces
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+@functools.lru_cache(maxsize=1)
+def _type_mapping() -> Dict[str, object]:
+    """Map schema type names to PyArrow types, built once on first use.
+
+    Returns:
+        Dict[str, pyarrow.DataType]: The type name to PyArrow type mapping
     """
     import pyarrow as pa
 
-    # Map string type names to PyArrow types
-    type_mapping = {
+    return {
         "int8": pa.int8(),
         "int16": pa.int16(),
         "int32": pa.int32(),
@@ -109,15 +204,80 @@ def _load_schema(schema_file: str):
         "time64": pa.time64("us"),
     }
 
-    with open(schema_file, "r") as f:
-        schema_json = json.load(f)
-        fields = []
-        for f in schema_json["fields"]:
-            type_name = f["type"]
-            if type_name not in type_mapping:
-                raise ValueError(f"Unsupported type: {type_name}")
-            fields.append(pa.field(f["name"], type_mapping[type_name]))
-        return pa.schema(fields)
+
+def _parse_type(type_name: str):
+    """Resolve a schema type name to a PyArrow type.
+
+    Names from _type_mapping are looked up first. Any other name pyarrow
+    prints for a type (e.g. "date32[day]", "timestamp[ms]", "large_string"
+    or "timestamp[us, tz=UTC]") is parsed, so every schema exported by
+    infer_and_export_schema can be loaded back.
+
+    Args:
+        type_name: The type name from the schema file
+
+    Returns:
+        pyarrow.DataType: The type, or None if the name is not a known type
+    """
+    import pyarrow as pa
+
+    arrow_type = _type_mapping().get(type_name)
+    if arrow_type is not None:
+        return arrow_type
+    match = TIMESTAMP_TZ_TYPE.fullmatch(type_name)
+    if match:
+        return pa.timestamp(match.group(1), tz=match.group(2))
+    try:
+        return pa.type_for_alias(type_name)
+    except ValueError:
+        return None
+
+
+def _load_schema(schema_file: str):
+    """Load schema from JSON file.
+
+    Args:
+        schema_file: Path to the JSON schema file
+
+    Returns:
+        pyarrow.Schema: The loaded schema object
+
+    Raises:
+        FileNotFoundError: If the schema file doesn't exist
+        json.JSONDecodeError: If the schema file contains invalid JSON
+        ValueError: If the schema structure is invalid
+    """
+    return _schema_from_json(_json_loads(Path(schema_file).read_bytes()))
+
+
+def _schema_from_json(schema_json: Dict):
+    """Build a pyarrow schema from its JSON representation.
+
+    Args:
+        schema_json: Dictionary with a "fields" list of {"name", "type"} entries,
+            as written by infer_and_export_schema
+
+    Returns:
+        pyarrow.Schema: The schema object
+
+    Raises:
+        ValueError: If the schema structure is invalid
+    """
+    import pyarrow as pa
+
+    field_defs = schema_json["fields"]
+    types = {
+        field_def["type"]: _parse_type(field_def["type"]) for field_def in field_defs
+    }
+
+    # Reject unknown types before building any field
+    unsupported = {name for name, arrow_type in types.items() if arrow_type is None}
+    if unsupported:
+        raise ValueError(f"Unsupported type: {', '.join(sorted(unsupported))}")
+
+    return pa.schema(
+        [(field_def["name"], types[field_def["type"]]) for field_def in field_defs]
+    )
 
 
 def _validate_chunking_support(
@@ -137,7 +297,7 @@ def _validate_chunking_support(
     Raises:
         NotImplementedError: If chunking is not supported for the specified formats
     """
-    if input_chunk_size and input_format not in CHUNKED_READ_FORMATS:
+    if input_chunk_size is not None and input_format not in CHUNKED_READ_FORMATS:
         raise NotImplementedError(
             f"Chunked reading is not supported for input format: {input_format}"
         )
@@ -147,13 +307,38 @@ def _validate_chunking_support(
         )
 
 
+def _autotune_chunk_size(schema, target_bytes: int = AUTO_CHUNK_TARGET_BYTES) -> int:
+    """Pick a number of rows per chunk so that each chunk is about target_bytes.
+
+    Fixed-width columns count their byte width; variable-width columns
+    (strings, binary, nested) are estimated at 16 bytes per value.
+
+    Args:
+        schema: The pyarrow schema of the data being chunked
+        target_bytes: Target in-memory size of one chunk
+
+    Returns:
+        int: Rows per chunk, clamped to [AUTO_CHUNK_MIN_ROWS, AUTO_CHUNK_MAX_ROWS]
+    """
+    row_bytes = 0
+    for field in schema:
+        try:
+            row_bytes += max(field.type.bit_width // 8, 1)
+        except ValueError:
+            row_bytes += 16
+    rows = target_bytes // max(row_bytes, 1)
+    return min(max(rows, AUTO_CHUNK_MIN_ROWS), AUTO_CHUNK_MAX_ROWS)
+
+
 def _create_chunked_reader(
     input_file: str,
     input_format: str,
     input_chunk_size: int,
     sas_encoding: Optional[str],
 ):
-    """Create a chunked reader for the input file.
+    """Create a pandas chunked reader for the input file.
+
+    CSV input is streamed by _create_arrow_chunked_reader instead.
 
     Args:
         input_file: Path to the input file
@@ -167,11 +352,7 @@ def _create_chunked_reader(
     Raises:
         NotImplementedError: If chunked reading is not implemented for the format
     """
-    if input_format == "csv":
-        return pd.read_csv(
-            input_file, chunksize=input_chunk_size, dtype_backend="pyarrow"
-        )
-    elif input_format == "sas7bdat":
+    if input_format == "sas7bdat":
         return pd.read_sas(
             input_file, chunksize=input_chunk_size, encoding=sas_encoding
         )
@@ -181,44 +362,440 @@ def _create_chunked_reader(
         )
 
 
-def _write_chunk_csv(chunk: pd.DataFrame, output_file: str, first: bool):
-    """Write a chunk to CSV file.
+def _open_dataset(input_file: str, input_format: str, skip_rows: int = 0):
+    """Open a Parquet, ORC or Feather file as a memory-mapped pyarrow dataset.
+
+    Memory mapping lets Arrow reference (uncompressed) file data in place
+    instead of copying it into freshly allocated read buffers. For Parquet,
+    whole row groups before skip_rows are dropped from the dataset using the
+    footer's row counts, so they are never read.
 
     Args:
-        chunk: The dataframe chunk to write
-        output_file: Path to the output CSV file
-        first: Whether this is the first chunk (determines write mode and header)
+        input_file: Path to the input file
+        input_format: The input file format (parquet, orc, feather)
+        skip_rows: Number of leading rows the caller is going to skip
+
+    Returns:
+        Tuple[pyarrow.dataset.Dataset, int]: The dataset and the number of
+        leading rows of it that still have to be skipped
     """
-    chunk.to_csv(
-        output_file,
-        mode="w" if first else "a",
-        header=first,
-        index=False,
+    import pyarrow.dataset as ds
+    from pyarrow import fs
+
+    dataset = ds.dataset(
+        input_file, format=input_format, filesystem=fs.LocalFileSystem(use_mmap=True)
     )
+    if input_format != "parquet" or skip_rows <= 0:
+        return dataset, skip_rows
+
+    row_groups = [
+        row_group
+        for fragment in dataset.get_fragments()
+        for row_group in fragment.split_by_row_group()
+    ]
+    first = 0
+    for row_group in row_groups:
+        num_rows = row_group.row_groups[0].num_rows
+        if skip_rows < num_rows:
+            break
+        skip_rows -= num_rows
+        first += 1
+    dataset = ds.FileSystemDataset(
+        row_groups[first:], dataset.schema, dataset.format, dataset.filesystem
+    )
+    return dataset, skip_rows
+
+
+def _arrow_csv_options(
+    input_format: str,
+    schema: Optional[object] = None,
+    columns: Optional[List[str]] = None,
+    skip_rows: int = 0,
+) -> Dict:
+    """Build the pyarrow.csv reader options for a delimited text input.
+
+    Args:
+        input_format: The delimited format (csv, tsv, psv)
+        schema: Optional PyArrow schema, or dictionary of column name to
+            type, used as column types
+        columns: Optional list of columns to read (all columns if None)
+        skip_rows: Number of data rows to skip after the header
+
+    Returns:
+        Dict: read_options, parse_options and convert_options keyword arguments
+    """
+    import pyarrow.csv as csv
+
+    return {
+        "read_options": csv.ReadOptions(
+            block_size=ARROW_CSV_BLOCK_SIZE, skip_rows_after_names=skip_rows
+        ),
+        "parse_options": csv.ParseOptions(delimiter=SEP_MAP[input_format]),
+        "convert_options": csv.ConvertOptions(
+            column_types=schema, strings_can_be_null=True, include_columns=columns
+        ),
+    }
+
+
+def _open_input(input_file: str):
+    """Open an input file for a single sequential scan.
+
+    The file is opened as an Arrow OSFile, bypassing Python's buffered IO,
+    and the kernel is told to expect sequential access so it reads ahead
+    more aggressively. Compressed inputs are decompressed on the fly.
+
+    Args:
+        input_file: Path to the input file
+
+    Returns:
+        pyarrow.NativeFile: A buffered input stream over the file
+    """
+    import pyarrow as pa
 
+    source = pa.OSFile(input_file, "rb")
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(source.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    codec = CODEC_EXTENSIONS.get(os.path.splitext(input_file)[1].lower())
+    return pa.input_stream(source, compression=codec, buffer_size=INPUT_BUFFER_SIZE)
 
-def _write_chunk_parquet(
-    chunk: pd.DataFrame, output_file: str, first: bool, pqwriter=None
+
+def _create_arrow_chunked_reader(
+    input_file: str,
+    input_chunk_size: int,
+    schema: Optional[object] = None,
+    columns: Optional[List[str]] = None,
 ):
-    """Write a chunk to Parquet file.
+    """Create a chunked reader yielding Arrow record batches from a CSV file.
+
+    The CSV is parsed block by block with pyarrow's streaming reader, and
+    each block is sliced (zero-copy) into batches of at most
+    ``input_chunk_size`` rows. A file without data rows yields a single
+    empty batch carrying the header's schema.
 
     Args:
-        chunk: The dataframe chunk to write
-        output_file: Path to the output Parquet file
-        first: Whether this is the first chunk
-        pqwriter: Existing ParquetWriter instance (None for first chunk)
+        input_file: Path to the input CSV file
+        input_chunk_size: Maximum number of rows per batch (0 to auto-size
+            from the inferred schema)
+        schema: Optional PyArrow schema, or dictionary of column name to
+            type, used as column types (other columns are inferred)
+        columns: Optional list of columns to read (all columns if None)
 
     Returns:
-        pyarrow.parquet.ParquetWriter: The ParquetWriter instance
+        Iterator[pyarrow.RecordBatch]: A record batch iterator
     """
     import pyarrow as pa
+    import pyarrow.csv as csv
+
+    with _open_input(input_file) as source:
+        reader = csv.open_csv(source, **_arrow_csv_options("csv", schema, columns))
+        if not input_chunk_size:
+            input_chunk_size = _autotune_chunk_size(reader.schema)
+        empty = True
+        for block in reader:
+            for offset in range(0, block.num_rows, input_chunk_size):
+                empty = False
+                yield block.slice(offset, input_chunk_size)
+        if empty:
+            # A header-only file still produces an (empty) output file
+            yield pa.RecordBatch.from_pylist([], schema=reader.schema)
+
+
+def _from_pandas_nthreads(df: pd.DataFrame) -> int:
+    """Pick the thread count for converting a dataframe to Arrow.
+
+    Numeric columns convert (almost) zero-copy, so narrow or all-numeric
+    frames are converted on one thread; otherwise one thread per column is
+    used, up to the number of CPUs.
+
+    Args:
+        df: The dataframe to convert
+
+    Returns:
+        int: The nthreads argument for pyarrow's from_pandas
+    """
+    ncols = len(df.columns)
+    if ncols < 4 or all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+        return 1
+    return min(os.cpu_count() or 1, ncols)
+
+
+def _to_record_batch(chunk, schema=None):
+    """Convert a pandas chunk to a pyarrow RecordBatch (batches pass through).
+
+    Args:
+        chunk: A pandas DataFrame or pyarrow RecordBatch
+        schema: Optional schema to convert pandas chunks with (skips inference)
+
+    Returns:
+        pyarrow.RecordBatch: The chunk as a record batch
+    """
+    import pyarrow as pa
+
+    if isinstance(chunk, pa.RecordBatch):
+        return chunk
+    return pa.RecordBatch.from_pandas(
+        chunk,
+        schema=schema,
+        preserve_index=False,
+        nthreads=_from_pandas_nthreads(chunk),
+    )
+
+
+def _resolve_chunk_schema(chunk, schema=None):
+    """Resolve the output schema of a chunked conversion from its first chunk.
+
+    Args:
+        chunk: The first chunk (pandas DataFrame or pyarrow RecordBatch)
+        schema: Optional user-supplied schema
+
+    Returns:
+        pyarrow.Schema: The schema every chunk is written with
+    """
+    import pyarrow as pa
+
+    if isinstance(chunk, pa.RecordBatch):
+        # Arrow readers already applied the user schema as column types
+        return chunk.schema
+    if schema is not None:
+        return schema
+    return pa.Schema.from_pandas(chunk, preserve_index=False)
+
+
+def _parquet_row_group_size(num_rows: int, nbytes: int) -> int:
+    """Pick a Parquet row group size targeting PARQUET_ROW_GROUP_TARGET_BYTES.
+
+    Args:
+        num_rows: Number of rows to be written
+        nbytes: In-memory size of those rows in bytes
+
+    Returns:
+        int: The number of rows per row group
+    """
+    row_bytes = max(1, nbytes // max(1, num_rows))
+    return max(PARQUET_MIN_ROW_GROUP_SIZE, PARQUET_ROW_GROUP_TARGET_BYTES // row_bytes)
+
+
+def _parquet_write_options(num_rows: int, nbytes: int) -> Dict:
+    """Build the Parquet writer tuning options for a whole-table write.
+
+    Args:
+        num_rows: Number of rows to be written
+        nbytes: In-memory size of those rows in bytes
+
+    Returns:
+        Dict: row_group_size, data_page_size and write_batch_size
+    """
+    return {
+        "row_group_size": _parquet_row_group_size(num_rows, nbytes),
+        "data_page_size": PARQUET_DATA_PAGE_SIZE,
+        "write_batch_size": PARQUET_WRITE_BATCH_SIZE,
+    }
+
+
+class _RowGroupWriter:
+    """Parquet writer that coalesces small batches into large row groups.
+
+    pyarrow's ParquetWriter starts a new row group on every write call, so
+    writing small chunks directly yields many tiny row groups. Batches are
+    buffered here until they reach PARQUET_ROW_GROUP_TARGET_BYTES, or
+    max_batches batches, and then written as a single row group.
+
+    Args:
+        writer: The underlying pyarrow.parquet.ParquetWriter
+        target_bytes: Buffered bytes at which a row group is written
+        max_batches: Buffered batches at which a row group is written (None
+            for no limit)
+    """
+
+    def __init__(
+        self,
+        writer,
+        target_bytes: int = PARQUET_ROW_GROUP_TARGET_BYTES,
+        max_batches: Optional[int] = None,
+    ):
+        self._writer = writer
+        self._target_bytes = target_bytes
+        self._max_batches = max_batches
+        self._batches = []
+        self._nbytes = 0
+
+    def write_batch(self, batch):
+        """Buffer a record batch, writing a row group once enough is buffered.
+
+        Args:
+            batch: The pyarrow RecordBatch to write
+        """
+        self._batches.append(batch)
+        self._nbytes += batch.nbytes
+        if self._nbytes >= self._target_bytes or (
+            self._max_batches is not None and len(self._batches) >= self._max_batches
+        ):
+            self._flush()
+
+    def _flush(self):
+        """Write the buffered batches as one row group."""
+        import pyarrow as pa
+
+        if not self._batches:
+            return
+        table = pa.Table.from_batches(self._batches)
+        if table.num_rows:
+            self._writer.write_table(table, row_group_size=table.num_rows)
+        self._batches = []
+        self._nbytes = 0
+
+    def close(self):
+        """Write any buffered batches and close the underlying writer."""
+        try:
+            self._flush()
+        finally:
+            self._writer.close()
+
+
+class _CSVChunkWriter:
+    """CSV writer that appends record batches with pandas' to_csv.
+
+    Each batch is converted to an Arrow-backed dataframe and formatted by
+    to_csv, like a non-chunked conversion formats the whole table, so chunked
+    and non-chunked conversions of the same input produce the same bytes. The
+    header is written with the first batch.
+
+    Args:
+        output_file: Path to the output file, or a writable binary file object
+    """
+
+    def __init__(self, output_file):
+        self._owned = not hasattr(output_file, "write")
+        self._file = open(output_file, "wb") if self._owned else output_file
+        self._header = True
+
+    def write_batch(self, batch):
+        """Append a record batch to the output.
+
+        Args:
+            batch: The pyarrow RecordBatch to write
+        """
+        df = batch.to_pandas(types_mapper=pd.ArrowDtype)
+        df.to_csv(self._file, index=False, header=self._header)
+        self._header = False
+
+    def close(self):
+        """Close the output file if it was opened by this writer."""
+        if self._owned:
+            self._file.close()
+
+
+def _open_chunk_writer(
+    output_file: str,
+    output_format: str,
+    schema,
+    write_kwargs: Optional[Dict] = None,
+    max_chunks: Optional[int] = None,
+):
+    """Open the single writer used for all chunks of a chunked conversion.
+
+    Args:
+        output_file: Path to the output file, or a writable binary file object
+        output_format: The output file format ("csv" or "parquet")
+        schema: The pyarrow schema of every chunk
+        write_kwargs: Parquet writer parameters (e.g., compression)
+        max_chunks: Maximum number of chunks coalesced into one Parquet row
+            group (None for no limit)
+
+    Returns:
+        _CSVChunkWriter or _RowGroupWriter: The open writer
+    """
+    if output_format == "csv":
+        return _CSVChunkWriter(output_file)
+
     import pyarrow.parquet as pq
 
-    table = pa.Table.from_pandas(chunk)
-    if first:
-        pqwriter = pq.ParquetWriter(output_file, table.schema)
-    pqwriter.write_table(table)
-    return pqwriter
+    return _RowGroupWriter(
+        pq.ParquetWriter(
+            output_file,
+            schema,
+            write_batch_size=PARQUET_WRITE_BATCH_SIZE,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+            **(write_kwargs or {}),
+        ),
+        max_batches=max_chunks,
+    )
+
+
+def _write_chunk_csv(chunk, csvwriter, schema=None):
+    """Write a chunk to CSV file.
+
+    Args:
+        chunk: The dataframe or record batch chunk to write
+        csvwriter: Open CSV chunk writer for the output file
+        schema: Schema to convert pandas chunks with
+    """
+    csvwriter.write_batch(_to_record_batch(chunk, schema))
+
+
+def _write_chunk_parquet(chunk, pqwriter, schema=None):
+    """Write a chunk to Parquet file.
+
+    Args:
+        chunk: The dataframe or record batch chunk to write
+        pqwriter: Open Parquet writer for the output file
+        schema: Schema to convert pandas chunks with
+    """
+    pqwriter.write_batch(_to_record_batch(chunk, schema))
+
+
+def _prefetch_chunks(reader, depth: int = CHUNK_PREFETCH_DEPTH):
+    """Read chunks on a background thread while the caller consumes them.
+
+    Parsing and writing both release the GIL in pyarrow, so reading the next
+    chunk overlaps with encoding and writing the current one. At most depth
+    chunks are buffered; reader exceptions are re-raised in the caller.
+
+    Args:
+        reader: Iterable of chunks (dataframes or record batches)
+        depth: Maximum number of chunks buffered ahead of the consumer
+
+    Yields:
+        The chunks of reader, in order
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    chunks = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # Poll so an abandoned consumer does not leave the producer blocked
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for chunk in reader:
+                if not put(chunk):
+                    return
+        except BaseException as e:
+            put(e)
+        else:
+            put(done)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(produce)
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
 
 
 def _handle_chunked_conversion(
@@ -228,33 +805,139 @@ def _handle_chunked_conversion(
     output_format: str,
     input_chunk_size: int,
     sas_encoding: Optional[str],
+    schema: Optional[object] = None,
+    write_kwargs: Optional[Dict] = None,
+    columns: Optional[List[str]] = None,
 ):
     """Handle chunked data conversion.
 
+    CSV input is streamed as Arrow record batches; other inputs are read in
+    pandas chunks. The output schema is resolved once, from the user schema
+    or the first chunk, and a single writer is kept open for the output.
+    Chunks are prefetched on a background thread so reading overlaps with
+    writing.
+
+    CSV column types are inferred from the first block of the file. When a
+    later block does not fit them, the offending column is widened (see
+    _widen_csv_column) and the conversion starts over.
+
     Args:
         input_file: Path to the input file
         output_file: Path to the output file
         input_format: The input file format
         output_format: The output file format
-        input_chunk_size: Size of input chunks
+        input_chunk_size: Size of input chunks (0 to auto-size)
         sas_encoding: Encoding for SAS files
+        schema: Optional PyArrow schema to use for reading/writing
+        write_kwargs: Parquet writer parameters (e.g., compression)
+        columns: Optional list of columns to keep (all columns if None)
+    """
+    if input_format != "csv":
+        if not input_chunk_size:
+            input_chunk_size = AUTO_CHUNK_DEFAULT_ROWS
+        reader = _create_chunked_reader(
+            input_file, input_format, input_chunk_size, sas_encoding
+        )
+        _write_chunks(reader, output_file, output_format, schema, write_kwargs, columns)
+        return
+
+    import pyarrow as pa
+
+    column_types = {}
+    while True:
+        reader = _create_arrow_chunked_reader(
+            input_file,
+            input_chunk_size,
+            schema if schema is not None else column_types or None,
+            columns,
+        )
+        try:
+            _write_chunks(
+                reader, output_file, output_format, schema, write_kwargs, columns
+            )
+            return
+        except pa.ArrowInvalid as e:
+            # A user schema is applied as is, its conversion errors are real
+            if schema is not None or not _widen_csv_column(
+                input_file, input_format, e, column_types
+            ):
+                raise
+
+
+def _widen_csv_column(
+    input_file: str, input_format: str, error, column_types: Dict
+) -> bool:
+    """Widen the CSV column that a streaming conversion error was raised for.
+
+    Integer columns are widened to float64 first; any other column, or an
+    integer column that still does not fit, is read as strings.
+
+    Args:
+        input_file: Path to the input delimited text file
+        input_format: The input file format (csv, tsv, psv)
+        error: The pyarrow.ArrowInvalid raised while reading the file
+        column_types: Column types forced so far, updated in place
+
+    Returns:
+        bool: True if a column was widened, False if the error is not a CSV
+        conversion error or the column is already read as strings
     """
-    reader = _create_chunked_reader(
-        input_file, input_format, input_chunk_size, sas_encoding
+    import pyarrow as pa
+    import pyarrow.csv as csv
+
+    match = CSV_CONVERSION_ERROR.search(str(error))
+    if match is None:
+        return False
+    with _open_input(input_file) as source:
+        names = csv.open_csv(source, **_arrow_csv_options(input_format)).schema.names
+    name = names[int(match.group(1))]
+
+    inferred = column_types.get(name)
+    if inferred == pa.string():
+        return False
+    if inferred is None and match.group(2).startswith(("int", "uint")):
+        widened = pa.float64()
+    else:
+        widened = pa.string()
+    column_types[name] = widened
+    console.print(
+        f"[yellow]Warning: Column '{name}' does not fit its inferred type, "
+        f"converting again with type {widened}."
     )
+    return True
 
-    first = True
-    pqwriter = None
 
-    for chunk in reader:
-        if output_format == "csv":
-            _write_chunk_csv(chunk, output_file, first)
-        elif output_format == "parquet":
-            pqwriter = _write_chunk_parquet(chunk, output_file, first, pqwriter)
-        first = False
+def _write_chunks(reader, output_file, output_format, schema, write_kwargs, columns):
+    """Write the chunks of a chunked reader through a single output writer.
 
-    if output_format == "parquet" and pqwriter:
-        pqwriter.close()
+    Args:
+        reader: Iterable of chunks (dataframes or record batches)
+        output_file: Path to the output file
+        output_format: The output file format ("csv" or "parquet")
+        schema: Optional PyArrow schema to write pandas chunks with
+        write_kwargs: Parquet writer parameters (e.g., compression)
+        columns: Optional list of columns to keep (all columns if None)
+    """
+    writer = None
+    try:
+        for chunk in _prefetch_chunks(reader):
+            chunk = _select_columns(chunk, columns)
+            if writer is None:
+                schema = _resolve_chunk_schema(chunk, schema)
+                writer = _open_chunk_writer(
+                    output_file,
+                    output_format,
+                    schema,
+                    write_kwargs,
+                    max_chunks=PARQUET_ROW_GROUP_MAX_CHUNKS,
+                )
+            if output_format == "csv":
+                _write_chunk_csv(chunk, writer, schema)
+            elif output_format == "parquet":
+                _write_chunk_parquet(chunk, writer, schema)
+    finally:
+        if writer is not None:
+            writer.close()
 
 
 def _build_read_kwargs(
@@ -295,6 +978,153 @@ def _build_read_kwargs(
     return read_kwargs
 
 
+def _read_arrow_table(
+    input_file: str,
+    input_format: str,
+    schema: Optional[object] = None,
+    nrows: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+    skip_rows: int = 0,
+):
+    """Read an Arrow-friendly file directly into a pyarrow Table.
+
+    Delimited text is parsed with pyarrow's multithreaded CSV reader, so
+    no intermediate pandas DataFrame is built. Parquet, ORC and Feather are
+    scanned as a pyarrow dataset, so unselected columns are never decoded
+    and the scan stops once nrows rows have been read.
+
+    Args:
+        input_file: Path to the input file
+        input_format: The input file format (csv, tsv, psv, parquet, orc, feather)
+        schema: Optional PyArrow schema used as column types for delimited text
+        nrows: Optional number of rows to read (after skip_rows)
+        columns: Optional list of columns to read (all columns if None)
+        skip_rows: Number of leading data rows to skip
+
+    Returns:
+        pyarrow.Table: The loaded table
+
+    Raises:
+        ValueError: If the input format cannot be read as an Arrow table
+    """
+    import pyarrow as pa
+
+    if input_format in SEP_MAP:
+        import pyarrow.csv as csv
+
+        options = _arrow_csv_options(input_format, schema, columns, skip_rows)
+        with _open_input(input_file) as source:
+            if nrows is None:
+                return csv.read_csv(source, **options)
+
+            # Stop parsing as soon as enough rows have been read
+            reader = csv.open_csv(source, **options)
+            batches = []
+            total = 0
+            for batch in reader:
+                batches.append(batch)
+                total += batch.num_rows
+                if total >= nrows:
+                    break
+        return pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows)
+    elif input_format in {"parquet", "orc", "feather"}:
+        dataset, skip_rows = _open_dataset(input_file, input_format, skip_rows)
+        scanner = dataset.scanner(columns=columns)
+        if nrows is None:
+            table = scanner.to_table()
+        else:
+            table = scanner.head(skip_rows + nrows)
+        return table.slice(skip_rows)
+    else:
+        raise ValueError(f"Unsupported Arrow input format: {input_format}")
+
+
+def _arrow_to_pandas(table) -> pd.DataFrame:
+    """Convert a pyarrow Table to an Arrow-backed dataframe, consuming it.
+
+    Columns are kept as separate blocks and each column's Arrow buffers are
+    released as soon as it has been converted, so peak memory stays close
+    to one copy of the data. The table must not be used afterwards.
+
+    Args:
+        table: The pyarrow Table to convert (invalidated by this call)
+
+    Returns:
+        pd.DataFrame: The dataframe with pyarrow dtypes
+    """
+    return table.to_pandas(
+        split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype
+    )
+
+
+def _read_arrow_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read delimited text, Parquet, ORC or Feather through pyarrow."""
+    table = _read_arrow_table(
+        input_file,
+        input_format,
+        schema,
+        nrows=read_kwargs.get("nrows"),
+        skip_rows=read_kwargs.get("skip_rows", 0),
+    )
+    return _arrow_to_pandas(table)
+
+
+def _read_sas_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read a SAS file, decoding strings with sas_encoding."""
+    return pd.read_sas(input_file, encoding=sas_encoding)
+
+
+def _read_stata_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read a Stata file."""
+    return pd.read_stata(input_file)
+
+
+def _read_spss_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read an SPSS file."""
+    return pd.read_spss(input_file)
+
+
+def _read_excel_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read an Excel sheet, using xlrd for legacy .xls files."""
+    if input_format == "xls":
+        read_kwargs = {**read_kwargs, "engine": "xlrd"}
+    return pd.read_excel(input_file, **read_kwargs)
+
+
+def _read_html_input(
+    input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+):
+    """Read the selected table (the first by default) of an HTML file."""
+    dfs = pd.read_html(input_file, **read_kwargs)
+    if table_number is not None and 0 <= table_number < len(dfs):
+        return dfs[table_number]
+    else:
+        return dfs[0]
+
+
+# Reader for each input format, dispatched by _read_dataframe
+READERS = {
+    **{fmt: _read_arrow_input for fmt in ARROW_READ_FORMATS},
+    "sas7bdat": _read_sas_input,
+    "stata": _read_stata_input,
+    "spss": _read_spss_input,
+    "excel": _read_excel_input,
+    "xlsx": _read_excel_input,
+    "xls": _read_excel_input,
+    "html": _read_html_input,
+}
+
+
 def _read_dataframe(
     input_file: str,
     input_format: str,
@@ -319,90 +1149,136 @@ def _read_dataframe(
     Raises:
         ValueError: If the input format is not supported
     """
-    if input_format == "csv" or input_format in SEP_MAP:
-        if schema:
-            try:
-                import pyarrow.csv as csv
-
-                arrow_kwargs = {}
-                if "sep" in read_kwargs:
-                    arrow_kwargs["delimiter"] = read_kwargs["sep"]
-                if "header" in read_kwargs:
-                    arrow_kwargs["header"] = read_kwargs["header"]
-                table = csv.read_csv(input_file, schema=schema, **arrow_kwargs)
-                return table.to_pandas()
-            except TypeError:
-                # Fallback: read with pandas, then apply schema manually
-                df = pd.read_csv(input_file, **read_kwargs)
-                # Apply datetime conversion for columns defined as timestamp in schema
-                for field in schema:
-                    if str(field.type).startswith("timestamp"):
-                        df[field.name] = pd.to_datetime(df[field.name])
-                return df
-        else:
-            return pd.read_csv(input_file, **read_kwargs)
-    elif input_format == "parquet":
-        return pd.read_parquet(input_file, **read_kwargs)
-    elif input_format == "orc":
-        return pd.read_orc(input_file, **read_kwargs)
-    elif input_format == "feather":
-        return pd.read_feather(input_file, **read_kwargs)
-    elif input_format == "sas7bdat":
-        return pd.read_sas(input_file, encoding=sas_encoding)
-    elif input_format == "stata":
-        return pd.read_stata(input_file)
-    elif input_format == "spss":
-        return pd.read_spss(input_file)
-    elif input_format in ["excel", "xlsx"]:
-        return pd.read_excel(input_file, **read_kwargs)
-    elif input_format == "xls":
-        # Ensure engine is set to xlrd for .xls files
-        read_kwargs = {**read_kwargs, "engine": "xlrd"}
-        return pd.read_excel(input_file, **read_kwargs)
-    elif input_format == "html":
-        dfs = pd.read_html(input_file, **read_kwargs)
-        if table_number is not None and 0 <= table_number < len(dfs):
-            return dfs[table_number]
-        else:
-            return dfs[0]
-    else:
+    reader = READERS.get(input_format)
+    if reader is None:
         raise ValueError(f"Unsupported input format: {input_format}")
+    return reader(
+        input_file, input_format, read_kwargs, sas_encoding, table_number, schema
+    )
 
 
-def _apply_row_selection(df: pd.DataFrame, rows: Optional[str]):
-    """Apply row selection to dataframe.
+def _parse_rows(rows: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse a row selection string.
 
     Args:
-        df: The dataframe to filter
         rows: Row selection string in format "start:end" (e.g., "0:100")
 
     Returns:
-        pd.DataFrame: The filtered dataframe (original if no selection or invalid)
+        Optional[Tuple[int, int]]: The (start, end) pair, or None if no
+        selection was given or it could not be parsed
     """
     if not rows:
-        return df
+        return None
 
     try:
         start, end = map(int, rows.split(":"))
-        return df.iloc[start:end]
     except Exception:
         console.print(
             f"[yellow]Warning: Could not parse rows '{rows}', ignoring row selection."
         )
+        return None
+    return start, end
+
+
+def _pushdown_rows(
+    row_window: Optional[Tuple[int, int]],
+) -> Tuple[int, Optional[int], Optional[Tuple[int, int]]]:
+    """Split a row window into what the readers can push down and the rest.
+
+    Args:
+        row_window: The (start, end) window, or None for all rows
+
+    Returns:
+        Tuple: (skip_rows, nrows, residual_window). Readers skip skip_rows
+        rows and then read at most nrows rows (all if None); residual_window
+        must still be sliced out of the result (None if nothing is left),
+        which is the case for windows counted from the end.
+    """
+    if row_window is None:
+        return 0, None, None
+    start, end = row_window
+    if min(start, end) < 0:
+        return 0, None, row_window
+    return start, max(end - start, 0), None
+
+
+def _slice_rows(df, row_window: Optional[Tuple[int, int]]):
+    """Slice a dataframe or pyarrow Table to a (start, end) row window.
+
+    Args:
+        df: The dataframe (or pyarrow Table) to slice
+        row_window: The (start, end) window, or None for all rows
+
+    Returns:
+        The sliced dataframe or table
+    """
+    if row_window is None:
+        return df
+
+    start, end = row_window
+    if isinstance(df, pd.DataFrame):
+        return df.iloc[start:end]
+    # Resolve negative and out-of-bounds indices the same way iloc does
+    window = range(df.num_rows)[start:end]
+    return df.slice(window.start, len(window))
+
+
+def _apply_row_selection(df, rows: Optional[str]):
+    """Apply row selection to dataframe.
+
+    Args:
+        df: The dataframe (or pyarrow Table) to filter
+        rows: Row selection string in format "start:end" (e.g., "0:100")
+
+    Returns:
+        The filtered dataframe or table (original if no selection or invalid)
+    """
+    return _slice_rows(df, _parse_rows(rows))
+
+
+def _select_columns(df, columns: Optional[List[str]]):
+    """Keep only the requested columns of a dataframe or record batch.
+
+    Args:
+        df: The dataframe (or pyarrow RecordBatch/Table) to project
+        columns: Columns to keep, in order (all columns if None)
+
+    Returns:
+        The projected dataframe or batch
+    """
+    if columns is None:
         return df
+    if isinstance(df, pd.DataFrame):
+        return df[columns]
+    return df.select(columns)
 
 
 def _convert_dtypes(df: pd.DataFrame):
     """Convert dataframe dtypes to pyarrow.
 
+    Columns that are already Arrow-backed (e.g. read with
+    dtype_backend="pyarrow") are left untouched, so a frame that is fully
+    Arrow-backed is returned as is instead of being copied.
+
     Args:
         df: The dataframe to convert
 
     Returns:
         pd.DataFrame: The dataframe with pyarrow dtypes
     """
-    if hasattr(df, "convert_dtypes"):
+    if not hasattr(df, "convert_dtypes"):
+        return df
+
+    pending = [
+        col for col, dtype in df.dtypes.items() if not isinstance(dtype, pd.ArrowDtype)
+    ]
+    if not pending:
+        return df
+    if len(pending) == len(df.columns):
         return df.convert_dtypes(dtype_backend="pyarrow")
+
+    df = df.copy(deep=False)
+    df[pending] = df[pending].convert_dtypes(dtype_backend="pyarrow")
     return df
 
 
@@ -437,6 +1313,80 @@ def _build_write_kwargs(
     return write_kwargs
 
 
+def _filter_write_kwargs(output_format: str, write_kwargs: Dict) -> Dict:
+    """Drop write parameters the output format's writer does not accept.
+
+    Args:
+        output_format: The output file format
+        write_kwargs: Dictionary of write parameters
+
+    Returns:
+        Dict: The parameters listed in WRITE_KWARGS for the format (all of
+        them for formats without an entry)
+    """
+    allowed = WRITE_KWARGS.get(output_format)
+    if allowed is None:
+        return write_kwargs
+
+    ignored = write_kwargs.keys() - allowed
+    if ignored:
+        console.print(
+            f"[yellow]Warning: {', '.join(sorted(ignored))} not supported for "
+            f"{output_format} output, ignoring."
+        )
+    return {key: value for key, value in write_kwargs.items() if key in allowed}
+
+
+def _write_csv_output(df, output_file, write_kwargs):
+    """Write a dataframe as comma-separated text."""
+    write_kwargs["sep"] = ","
+    df.to_csv(output_file, index=False, **write_kwargs)
+
+
+def _write_parquet_output(df, output_file, write_kwargs):
+    """Write a dataframe as Parquet, with row groups sized to the data."""
+    options = _parquet_write_options(len(df), int(df.memory_usage(index=False).sum()))
+    df.to_parquet(output_file, index=False, **{**options, **write_kwargs})
+
+
+def _write_orc_output(df, output_file, write_kwargs):
+    """Write a dataframe as ORC."""
+    df.to_orc(output_file, index=False, **write_kwargs)
+
+
+def _write_feather_output(df, output_file, write_kwargs):
+    """Write a dataframe as Feather, without its index."""
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(
+        df, preserve_index=False, safe=False, nthreads=_from_pandas_nthreads(df)
+    )
+    _write_arrow_table(table, output_file, "feather", write_kwargs)
+
+
+def _write_excel_output(df, output_file, write_kwargs):
+    """Write a dataframe as an Excel sheet."""
+    df.to_excel(output_file, index=False, **write_kwargs)
+
+
+def _write_stata_output(df, output_file, write_kwargs):
+    """Write a dataframe as Stata (which has no index parameter)."""
+    df.to_stata(output_file, **write_kwargs)
+
+
+# Writer for each output format, dispatched by _write_dataframe
+WRITERS = {
+    "csv": _write_csv_output,
+    "parquet": _write_parquet_output,
+    "orc": _write_orc_output,
+    "feather": _write_feather_output,
+    "excel": _write_excel_output,
+    "xlsx": _write_excel_output,
+    "xls": _write_excel_output,
+    "stata": _write_stata_output,
+}
+
+
 def _write_dataframe(
     df: pd.DataFrame, output_file: str, output_format: str, write_kwargs: Dict
 ):
@@ -451,22 +1401,201 @@ def _write_dataframe(
     Raises:
         ValueError: If the output format is not supported
     """
-    if output_format == "csv":
-        write_kwargs["sep"] = ","
-        df.to_csv(output_file, index=False, **write_kwargs)
-    elif output_format == "parquet":
-        df.to_parquet(output_file, index=False, **write_kwargs)
+    writer = WRITERS.get(output_format)
+    if writer is None:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    writer(df, output_file, _filter_write_kwargs(output_format, write_kwargs))
+
+
+def _write_arrow_table(table, output_file: str, output_format: str, write_kwargs: Dict):
+    """Write a pyarrow Table to file without converting it to pandas.
+
+    Args:
+        table: The pyarrow Table to write
+        output_file: Path to the output file
+        output_format: The output file format (parquet, orc, feather)
+        write_kwargs: Dictionary of write parameters
+
+    Raises:
+        ValueError: If the output format cannot be written from an Arrow table
+    """
+    write_kwargs = _filter_write_kwargs(output_format, write_kwargs)
+    if output_format == "parquet":
+        import pyarrow.parquet as pq
+
+        options = _parquet_write_options(table.num_rows, table.nbytes)
+        pq.write_table(table, output_file, **{**options, **write_kwargs})
     elif output_format == "orc":
-        df.to_orc(output_file, index=False, **write_kwargs)
+        import pyarrow.orc as orc
+
+        orc.write_table(table, output_file, **write_kwargs)
     elif output_format == "feather":
-        df.to_feather(output_file, **write_kwargs)
-    elif output_format in ["excel", "xlsx", "xls"]:
-        df.to_excel(output_file, index=False, **write_kwargs)
-    elif output_format == "stata":
-        # stata doesn't support index parameter
-        df.to_stata(output_file, **write_kwargs)
+        import pyarrow.feather as feather
+
+        feather.write_feather(
+            table, output_file, chunksize=FEATHER_CHUNK_SIZE, **write_kwargs
+        )
     else:
-        raise ValueError(f"Unsupported output format: {output_format}")
+        raise ValueError(f"Unsupported Arrow output format: {output_format}")
+
+
+@contextlib.contextmanager
+def _open_batch_reader(
+    input_file: str,
+    input_format: str,
+    schema: Optional[object] = None,
+    columns: Optional[List[str]] = None,
+    skip_rows: int = 0,
+):
+    """Open a streaming record batch reader over an Arrow-readable input.
+
+    Args:
+        input_file: Path to the input file
+        input_format: The input file format (csv, tsv, psv, parquet, orc, feather)
+        schema: Optional PyArrow schema used as column types for delimited text
+        columns: Optional list of columns to read (all columns if None)
+        skip_rows: Number of leading data rows the caller is going to skip
+
+    Yields:
+        Tuple: An iterable of pyarrow RecordBatches with a schema attribute,
+        and the number of its leading rows that still have to be skipped
+    """
+    if input_format in SEP_MAP:
+        import pyarrow.csv as csv
+
+        options = _arrow_csv_options(input_format, schema, columns, skip_rows)
+        with _open_input(input_file) as source:
+            yield csv.open_csv(source, **options), 0
+    else:
+        dataset, skip_rows = _open_dataset(input_file, input_format, skip_rows)
+        scanner = dataset.scanner(columns=columns, batch_size=TRANSCODE_BATCH_SIZE)
+        yield scanner.to_reader(), skip_rows
+
+
+def _window_batches(batches, start: int, end: Optional[int]):
+    """Yield the rows [start, end) of a record batch stream.
+
+    Batches before the window are skipped and reading stops at its end.
+
+    Args:
+        batches: Iterable of pyarrow RecordBatches
+        start: First row to keep (non-negative)
+        end: Row to stop at, exclusive (non-negative, None for no limit)
+
+    Yields:
+        pyarrow.RecordBatch: The (zero-copy sliced) batches inside the window
+    """
+    offset = 0
+    for batch in batches:
+        if end is not None and offset >= end:
+            return
+        lo = max(start - offset, 0)
+        hi = batch.num_rows if end is None else min(end - offset, batch.num_rows)
+        if hi > lo:
+            yield batch.slice(lo, hi - lo)
+        offset += batch.num_rows
+
+
+def _transcode_to_parquet(
+    input_file: str,
+    input_format: str,
+    output_file: str,
+    write_kwargs: Dict,
+    columns: Optional[List[str]] = None,
+    schema: Optional[object] = None,
+    skip_rows: int = 0,
+    nrows: Optional[int] = None,
+):
+    """Stream an Arrow-readable file into a Parquet file.
+
+    Record batches are read from the input and written as they arrive,
+    so the table is never materialised in memory, and reading the next batch
+    overlaps with encoding the current one.
+
+    Delimited text column types are inferred from the first block of the
+    file. When a later block does not fit them, the offending column is
+    widened (see _widen_csv_column) and the file is transcoded again.
+
+    Args:
+        input_file: Path to the input file
+        input_format: The input file format (csv, tsv, psv, parquet, orc, feather)
+        output_file: Path to the output Parquet file
+        write_kwargs: Parquet writer parameters (e.g., compression)
+        columns: Optional list of columns to keep (all columns if None)
+        schema: Optional PyArrow schema used as column types for delimited text
+        skip_rows: Number of leading data rows to skip
+        nrows: Optional number of rows to write (after skip_rows)
+    """
+    import pyarrow as pa
+
+    column_types = {}
+    while True:
+        try:
+            _transcode_batches(
+                input_file,
+                input_format,
+                output_file,
+                write_kwargs,
+                columns,
+                schema if schema is not None else column_types or None,
+                skip_rows,
+                nrows,
+            )
+            return
+        except pa.ArrowInvalid as e:
+            # A user schema is applied as is, its conversion errors are real
+            if (
+                input_format not in SEP_MAP
+                or schema is not None
+                or not _widen_csv_column(input_file, input_format, e, column_types)
+            ):
+                raise
+
+
+def _transcode_batches(
+    input_file: str,
+    input_format: str,
+    output_file: str,
+    write_kwargs: Dict,
+    columns: Optional[List[str]],
+    schema: Optional[object],
+    skip_rows: int,
+    nrows: Optional[int],
+):
+    """Make one streaming pass of _transcode_to_parquet.
+
+    Args:
+        input_file: Path to the input file
+        input_format: The input file format (csv, tsv, psv, parquet, orc, feather)
+        output_file: Path to the output Parquet file
+        write_kwargs: Parquet writer parameters (e.g., compression)
+        columns: Optional list of columns to keep (all columns if None)
+        schema: Optional PyArrow schema, or dict of column name to type, used
+            as column types for delimited text
+        skip_rows: Number of leading data rows to skip
+        nrows: Optional number of rows to write (after skip_rows)
+    """
+    with _open_batch_reader(input_file, input_format, schema, columns, skip_rows) as (
+        reader,
+        skip,
+    ):
+        prefetched = _prefetch_chunks(reader)
+        try:
+            batches = prefetched
+            if skip or nrows is not None:
+                end = None if nrows is None else skip + nrows
+                batches = _window_batches(batches, skip, end)
+            writer = _open_chunk_writer(
+                output_file, "parquet", reader.schema, write_kwargs
+            )
+            try:
+                for batch in batches:
+                    writer.write_batch(batch)
+            finally:
+                writer.close()
+        finally:
+            # Stop the read-ahead thread before the input is closed
+            prefetched.close()
 
 
 def convert_data(
@@ -484,6 +1613,8 @@ def convert_data(
     output_chunk_size: Optional[int] = None,
     schema_file: Optional[str] = None,
     config: Optional[Dict] = None,
+    columns: Optional[List[str]] = None,
+    schema=None,
 ):
     """Convert data from one format to another using pandas and pyarrow.
 
@@ -502,14 +1633,23 @@ def convert_data(
         sheet_name: Sheet name for Excel files
         table_number: Table number for HTML files (0-indexed)
         sas_keep_bytes: Keep SAS data as bytes instead of converting to UTF-8
-        input_chunk_size: Size of chunks for reading (enables chunked processing)
+        input_chunk_size: Size of chunks for reading (enables chunked processing;
+            0 picks a cache-friendly size automatically)
         output_chunk_size: Size of chunks for writing (currently unused)
         schema_file: Optional JSON file specifying schema to use for reading/writing
         config: Additional configuration (currently unused)
+        columns: Optional list of columns to keep, in order (all columns if None).
+            Parquet, ORC, Feather and delimited text skip unselected columns
+            while reading.
+        schema: Optional in-memory schema, either a pyarrow.Schema or a
+            dictionary with the same structure as a schema file (e.g. the one
+            returned by infer_and_export_schema). Cannot be combined with
+            schema_file.
 
     Raises:
         NotImplementedError: If chunking is not supported for the specified formats
-        ValueError: If input or output format is not supported
+        ValueError: If input or output format is not supported, or if both
+            schema and schema_file are given
         FileNotFoundError: If input file or schema file doesn't exist
         Exception: For other conversion errors
 
@@ -525,28 +1665,105 @@ def convert_data(
         sas_encoding = None if sas_keep_bytes else "utf-8"
 
         # Load schema if provided
+        if schema is not None and schema_file:
+            raise ValueError("Specify either schema or schema_file, not both")
         user_schema = None
-        if schema_file:
+        if isinstance(schema, dict):
+            user_schema = _schema_from_json(schema)
+        elif schema is not None:
+            user_schema = schema
+        elif schema_file:
             user_schema = _load_schema(schema_file)
 
         # Validate chunking support
         _validate_chunking_support(in_fmt, out_fmt, input_chunk_size, output_chunk_size)
 
         # Handle chunked conversion
-        if input_chunk_size:
+        if input_chunk_size is not None:
+            write_kwargs = _build_write_kwargs(
+                compression, compression_level, None, out_fmt
+            )
             _handle_chunked_conversion(
-                input_file, output_file, in_fmt, out_fmt, input_chunk_size, sas_encoding
+                input_file,
+                output_file,
+                in_fmt,
+                out_fmt,
+                input_chunk_size,
+                sas_encoding,
+                user_schema,
+                write_kwargs,
+                columns,
+            )
+            return
+
+        row_window = _parse_rows(rows)
+
+        # Same columnar format and nothing to change: copy the file as is
+        if (
+            in_fmt == out_fmt
+            and in_fmt in PASSTHROUGH_FORMATS
+            and row_window is None
+            and columns is None
+            and compression is None
+            and compression_level is None
+            and user_schema is None
+        ):
+            try:
+                shutil.copyfile(input_file, output_file)
+            except shutil.SameFileError:
+                pass
+            return
+
+        skip_rows, nrows, row_window = _pushdown_rows(row_window)
+
+        # Arrow to Parquet conversion, streamed batch by batch. Windows counted
+        # from the end need the row count and go through a full table instead.
+        if in_fmt in ARROW_READ_FORMATS and out_fmt == "parquet" and row_window is None:
+            write_kwargs = _build_write_kwargs(
+                compression, compression_level, sheet_name, out_fmt
+            )
+            _transcode_to_parquet(
+                input_file,
+                in_fmt,
+                output_file,
+                write_kwargs,
+                columns,
+                user_schema,
+                skip_rows,
+                nrows,
+            )
+            return
+
+        # Arrow-native conversion, no pandas DataFrame is ever built
+        if in_fmt in ARROW_READ_FORMATS and out_fmt in ARROW_WRITE_FORMATS:
+            table = _read_arrow_table(
+                input_file,
+                in_fmt,
+                user_schema,
+                nrows=nrows,
+                columns=columns,
+                skip_rows=skip_rows,
             )
+            table = _slice_rows(table, row_window)
+            write_kwargs = _build_write_kwargs(
+                compression, compression_level, sheet_name, out_fmt
+            )
+            _write_arrow_table(table, output_file, out_fmt, write_kwargs)
             return
 
         # Non-chunked conversion
         read_kwargs = _build_read_kwargs(in_fmt, sheet_name, table_number)
+        if in_fmt in ARROW_READ_FORMATS:
+            # Only read the rows inside the row window
+            read_kwargs["skip_rows"] = skip_rows
+            read_kwargs["nrows"] = nrows
         df = _read_dataframe(
             input_file, in_fmt, read_kwargs, sas_encoding, table_number, user_schema
         )
 
         # Process dataframe
-        df = _apply_row_selection(df, rows)
+        df = _select_columns(df, columns)
+        df = _slice_rows(df, row_window)
         df = _convert_dtypes(df)
 
         # Write dataframe
@@ -562,12 +1779,64 @@ def convert_data(
         raise
 
 
+def _init_convert_worker():
+    """Limit each conversion worker process to one Arrow compute thread.
+
+    Parallelism comes from the process pool, so per-process thread pools
+    would only oversubscribe the cores.
+    """
+    import pyarrow as pa
+
+    pa.set_cpu_count(1)
+
+
+def convert_many(
+    jobs: List[Tuple[str, str]], max_workers: Optional[int] = None, **kwargs
+):
+    """Convert several files in parallel, one worker process per file.
+
+    Each job runs convert_data in its own process, so CPU-bound work such as
+    pandas glue code and Parquet encoding/compression scales across cores
+    instead of being serialized by the GIL.
+
+    Args:
+        jobs: List of (input_file, output_file) pairs to convert
+        max_workers: Number of worker processes (default: number of CPUs)
+        **kwargs: Options passed to convert_data for every job
+            (e.g., compression="zstd")
+
+    Raises:
+        Exception: The first error raised by any of the conversions
+
+    Example:
+        >>> convert_many(
+        ...     [("a.csv", "a.parquet"), ("b.csv", "b.parquet")],
+        ...     compression="zstd",
+        ... )
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if not jobs:
+        return
+
+    convert = functools.partial(convert_data, **kwargs)
+    inputs, outputs = zip(*jobs)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_convert_worker
+    ) as executor:
+        # Consume the results so worker errors are re-raised here
+        list(executor.map(convert, inputs, outputs))
+
+
 def _get_schema_from_arrow_format(input_file: str, input_format: str):
-    """Get schema from Arrow-based formats (parquet, feather).
+    """Get schema from Arrow-based formats (parquet, feather, orc).
+
+    Only the file metadata (Parquet footer, Feather/ORC header) is read, not
+    the data itself.
 
     Args:
         input_file: Path to the input file
-        input_format: The input file format ("parquet" or "feather")
+        input_format: The input file format ("parquet", "feather" or "orc")
 
     Returns:
         pyarrow.Schema: The schema from the Arrow file
@@ -575,10 +1844,16 @@ def _get_schema_from_arrow_format(input_file: str, input_format: str):
     import pyarrow as pa
 
     if input_format == "feather":
-        table = pa.ipc.open_file(input_file)
+        with pa.memory_map(input_file) as source:
+            return pa.ipc.open_file(source).schema
+    elif input_format == "orc":
+        import pyarrow.orc as orc
+
+        return orc.ORCFile(input_file).schema
     else:  # parquet
-        table = pa.parquet.read_table(input_file)
-    return table.schema
+        import pyarrow.parquet as pq
+
+        return pq.read_schema(input_file, memory_map=True)
 
 
 def _get_schema_from_pandas_format(
@@ -610,19 +1885,22 @@ def _get_schema_from_pandas_format(
     return pa.Schema.from_pandas(df)
 
 
-def _export_schema_to_json(schema, output_file: str):
+def _export_schema_to_json(schema, output_file: str) -> Dict:
     """Export schema to JSON file.
 
     Args:
         schema: The pyarrow schema to export
         output_file: Path to the output JSON file
 
+    Returns:
+        The exported JSON structure, as a dictionary
+
     Raises:
         IOError: If the file cannot be written
     """
     schema_json = {"fields": [{"name": f.name, "type": str(f.type)} for f in schema]}
-    with open(output_file, "w") as f:
-        json.dump(schema_json, f, indent=2)
+    Path(output_file).write_bytes(_json_dumps(schema_json))
+    return schema_json
 
 
 def infer_and_export_schema(
@@ -633,12 +1911,13 @@ def infer_and_export_schema(
     sheet_name: Optional[str] = None,
     table_number: Optional[int] = None,
     sas_keep_bytes: bool = False,
-):
+) -> Dict:
     """Infer schema from input file and export as JSON.
 
     This function reads a sample of the input file to infer the data schema
     and exports it as a JSON file. For large files, it only reads the first
-    nrows to speed up schema inference.
+    nrows to speed up schema inference. The exported structure is also
+    returned, so it can be passed to convert_data without re-reading the file.
 
     Args:
         input_file: Path to the input file
@@ -649,6 +1928,9 @@ def infer_and_export_schema(
         table_number: Table number for HTML files (0-indexed)
         sas_keep_bytes: Keep SAS data as bytes instead of converting to UTF-8
 
+    Returns:
+        The exported schema as a dictionary with a "fields" list
+
     Raises:
         ValueError: If input format is not supported
         FileNotFoundError: If input file doesn't exist
@@ -662,7 +1944,7 @@ def infer_and_export_schema(
     sas_encoding = None if sas_keep_bytes else "utf-8"
 
     # Handle Arrow-based formats
-    if in_fmt in {"parquet", "feather"}:
+    if in_fmt in {"parquet", "feather", "orc"}:
         schema = _get_schema_from_arrow_format(input_file, in_fmt)
     else:
         # Handle pandas-based formats
@@ -682,4 +1964,4 @@ def infer_and_export_schema(
         )
 
     # Export schema to JSON
-    _export_schema_to_json(schema, output_file)
+    return _export_schema_to_json(schema, output_file)
@@ -5,10 +5,12 @@ This module contains utility functions used throughout the daflip package,
 including format inference and other helper functions.
 """
 
+import functools
 import os
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1024)
 def infer_format(file_path: str, override: Optional[str] = None) -> str:
     """Infer file format from file extension or use override.
 
@@ -16,6 +18,9 @@ def infer_format(file_path: str, override: Optional[str] = None) -> str:
     or from an explicit override parameter. The override takes precedence
     if provided.
 
+    Results are memoized, since the same paths are inferred repeatedly when
+    converting many files.
+
     Args:
         file_path: Path to the file (used to extract extension)
         override: Optional format override (e.g., "csv", "parquet")
@@ -0,0 +1,360 @@
+"""
+Shared fixtures for the daflip test suite.
+
+Input files that tests only read are written once per session into a
+``tmp_path_factory`` directory, so each test pays only for the conversion it
+exercises and writes its outputs into its own ``tmp_path``.
+
+On hosts with a RAM-backed filesystem (``/dev/shm`` on Linux, or the directory
+named by ``DAFLIP_TEST_TMPDIR``) the session's temporary files live there, so
+round-trips measure the conversion code rather than disk writeback. An
+explicit ``--basetemp`` always wins.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.helpers import write_json
+
+# Default RAM-backed directory for the session's temporary files
+RAM_TMPDIR = "/dev/shm"
+
+# Temporary directory created by pytest_configure, removed on unconfigure
+_ram_basetemp = None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    """Point pytest's basetemp at a RAM-backed directory when available.
+
+    Args:
+        config: The pytest configuration object
+    """
+    global _ram_basetemp
+
+    ram_dir = os.environ.get("DAFLIP_TEST_TMPDIR", RAM_TMPDIR)
+    if (
+        config.option.basetemp is None
+        and not hasattr(config, "workerinput")  # xdist workers inherit it
+        and os.path.isdir(ram_dir)
+        and os.access(ram_dir, os.W_OK)
+    ):
+        _ram_basetemp = tempfile.mkdtemp(prefix="daflip-tests-", dir=ram_dir)
+        config.option.basetemp = _ram_basetemp
+
+
+def pytest_unconfigure(config):
+    """Release the RAM-backed temporary directory.
+
+    Args:
+        config: The pytest configuration object
+    """
+    if _ram_basetemp is not None:
+        shutil.rmtree(_ram_basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the Arrow modules once, before any test runs.
+
+    daflip imports pyarrow lazily, so without this the first conversion of the
+    session would also pay the import cost and skew its timing. Under xdist
+    this runs once per worker.
+    """
+    import pyarrow
+    import pyarrow.csv
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    try:
+        import pyarrow.orc  # noqa: F401
+    except ImportError:
+        pass  # ORC support is optional in pyarrow builds
+
+
+@pytest.fixture
+def local_input(tmp_path):
+    """Factory giving a test its own path to a session-wide input file.
+
+    The file is hard-linked into the test's tmp_path, which costs no copy,
+    and is copied instead where hard links are unavailable. A hard link shares
+    the file's contents, so tests must still treat their input as read-only.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+
+    Returns:
+        Function mapping a session input path to the test-local path
+    """
+
+    def link(source):
+        target = tmp_path / source.name
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+        return target
+
+    return link
+
+
+@pytest.fixture(scope="session")
+def tiny_df():
+    """Three-row frame with an integer and a string column.
+
+    Shared by the whole session, so tests must not modify it.
+
+    Returns:
+        The dataframe
+    """
+    return pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+
+@pytest.fixture(scope="session")
+def tiny_bytes(tiny_df):
+    """The tiny frame encoded in every format, once per session.
+
+    Tests write the bytes into their tmp_path instead of running a pandas
+    writer per test.
+
+    Args:
+        tiny_df: Session fixture with the tiny dataframe
+
+    Returns:
+        Dict mapping a format (csv, tsv, psv, parquet, feather, orc) to the
+        file contents
+    """
+    writers = {
+        "csv": lambda buf: tiny_df.to_csv(buf, index=False),
+        "tsv": lambda buf: tiny_df.to_csv(buf, sep="\t", index=False),
+        "psv": lambda buf: tiny_df.to_csv(buf, sep="|", index=False),
+        "parquet": lambda buf: tiny_df.to_parquet(buf, index=False),
+        "feather": lambda buf: tiny_df.to_feather(buf),
+        "orc": lambda buf: tiny_df.to_orc(buf, index=False),
+    }
+    encoded = {}
+    for fmt, write in writers.items():
+        buffer = io.BytesIO()
+        write(buffer)
+        encoded[fmt] = buffer.getvalue()
+    return encoded
+
+
+@pytest.fixture(scope="session")
+def tiny_files(tmp_path_factory, tiny_bytes):
+    """Session-wide directory with the tiny frame in every Arrow-readable format.
+
+    Holds input.csv, input.parquet, input.feather and input.orc. Tests only
+    read these files and write their outputs into their own tmp_path.
+
+    Args:
+        tmp_path_factory: Pytest fixture creating session temporary directories
+        tiny_bytes: Session fixture encoding the tiny frame per format
+
+    Returns:
+        Path to the directory
+    """
+    directory = tmp_path_factory.mktemp("tiny")
+    for fmt in ("csv", "parquet", "feather", "orc"):
+        (directory / f"input.{fmt}").write_bytes(tiny_bytes[fmt])
+    return directory
+
+
+@pytest.fixture(scope="session")
+def medium_df():
+    """100-row frame with an integer and a "row_<i>" string column.
+
+    Shared by the whole session, so tests must not modify it.
+
+    Returns:
+        The dataframe
+    """
+    ids = np.arange(100)
+    return pd.DataFrame({"a": ids, "b": np.char.add("row_", ids.astype(str))})
+
+
+@pytest.fixture(scope="session")
+def medium_csv_bytes(medium_df):
+    """The 100-row frame encoded as CSV, once per session.
+
+    Args:
+        medium_df: Session fixture with the 100-row dataframe
+
+    Returns:
+        The CSV file contents
+    """
+    return medium_df.to_csv(index=False).encode()
+
+
+@pytest.fixture(scope="session")
+def excel_two_sheets_bytes(tiny_df):
+    """XLSX workbook with the tiny frame on Sheet1 and another on Sheet2.
+
+    Building a workbook is far slower than writing a CSV, so it is built once
+    per session and tests write the bytes into their tmp_path.
+
+    Args:
+        tiny_df: Session fixture with the tiny dataframe
+
+    Returns:
+        The workbook file contents
+    """
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        tiny_df.to_excel(writer, sheet_name="Sheet1", index=False)
+        pd.DataFrame({"c": [4, 5, 6], "d": ["a", "b", "c"]}).to_excel(
+            writer, sheet_name="Sheet2", index=False
+        )
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def fixture_dir(tmp_path_factory):
+    """Session-wide directory holding the read-only input files.
+
+    Args:
+        tmp_path_factory: Pytest fixture creating session temporary directories
+
+    Returns:
+        Path to the fixtures directory
+    """
+    return tmp_path_factory.mktemp("fixtures")
+
+
+@pytest.fixture(scope="session")
+def small_csv(fixture_dir):
+    """Five-row CSV with integer, string, float and boolean columns.
+
+    Args:
+        fixture_dir: Session-wide fixtures directory
+
+    Returns:
+        Tuple of (path to the CSV file, source dataframe)
+    """
+    df = pd.DataFrame(
+        {
+            "int_col": [1, 2, 3, 4, 5],
+            "str_col": ["a", "b", "c", "d", "e"],
+            "float_col": [1.1, 2.2, 3.3, 4.4, 5.5],
+            "bool_col": [True, False, True, False, True],
+        }
+    )
+    path = fixture_dir / "small.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+@pytest.fixture(scope="session")
+def small_file(request, fixture_dir, small_csv):
+    """The small frame stored in the format given by indirect parametrization.
+
+    Args:
+        request: Pytest request; request.param is the format (csv, parquet,
+            feather)
+        fixture_dir: Session-wide fixtures directory
+        small_csv: Session fixture with the small CSV and its dataframe
+
+    Returns:
+        Path to the file
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    csv_path, df = small_csv
+    fmt = request.param
+    if fmt == "csv":
+        return csv_path
+    writers = {"parquet": pq.write_table, "feather": feather.write_feather}
+    path = fixture_dir / f"small.{fmt}"
+    writers[fmt](pa.Table.from_pandas(df, preserve_index=False), str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def rows_csv(request, fixture_dir):
+    """id/value/score CSV input with the row count given by indirect parametrization.
+
+    Args:
+        request: Pytest request; request.param is the number of rows
+        fixture_dir: Session-wide fixtures directory
+
+    Returns:
+        Tuple of (path to the CSV file, source dataframe)
+    """
+    size = request.param
+    ids = np.arange(size, dtype=np.int32)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "value": np.char.add("row_", ids.astype(str)),
+            "score": ids * 0.1,
+        }
+    )
+    path = fixture_dir / f"rows_{size}.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+@pytest.fixture(scope="session")
+def text_csv(fixture_dir):
+    """100-row CSV with a repetitive text column, used by compression tests.
+
+    Args:
+        fixture_dir: Session-wide fixtures directory
+
+    Returns:
+        Tuple of (path to the CSV file, source dataframe)
+    """
+    ids = np.arange(100, dtype=np.int64)
+    df = pd.DataFrame(
+        {
+            "id": ids,
+            "text": np.char.multiply(np.char.add("long_text_", ids.astype(str)), 10),
+            "number": ids,
+        }
+    )
+    path = fixture_dir / "text.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+@pytest.fixture(scope="session")
+def valid_schema_file(fixture_dir):
+    """Schema JSON file with an int64 and a string field, written once.
+
+    Args:
+        fixture_dir: Session-wide fixtures directory
+
+    Returns:
+        Path to the schema file, as a string
+    """
+    path = fixture_dir / "schema.json"
+    write_json(
+        path,
+        {
+            "fields": [
+                {"name": "col1", "type": "int64"},
+                {"name": "col2", "type": "string"},
+            ]
+        },
+    )
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def two_field_schema():
+    """Arrow schema with an int64 field "a" and a string field "b".
+
+    Returns:
+        The pyarrow schema
+    """
+    import pyarrow as pa
+
+    return pa.schema([pa.field("a", pa.int64()), pa.field("b", pa.string())])
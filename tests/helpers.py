@@ -0,0 +1,106 @@
+"""
+Assertion and I/O helpers shared by the daflip test modules.
+"""
+
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+def assert_roundtrip_equal(path, df: pd.DataFrame, fmt: str):
+    """Assert that a converted file holds exactly the dataframe's data.
+
+    The file is read as a pyarrow Table and compared with the dataframe in
+    one Arrow equality check. The expected table is cast to the file's schema
+    first, so differences in dtype width are ignored (like check_dtype=False).
+
+    Args:
+        path: Path to the converted file, or a binary buffer holding it
+        df: The dataframe the file should contain
+        fmt: Format of the file (parquet, feather or csv)
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    readers = {
+        "parquet": pq.read_table,
+        "feather": feather.read_table,
+        "csv": pacsv.read_csv,
+    }
+    if isinstance(path, io.IOBase):
+        path.seek(0)
+        actual = readers[fmt](path)
+    else:
+        actual = readers[fmt](str(path))
+    expected = pa.Table.from_pandas(df, preserve_index=False).cast(actual.schema)
+    assert actual.equals(expected), f"{path} differs from the source dataframe"
+
+
+def assert_frame_values_equal(expected: pd.DataFrame, actual: pd.DataFrame):
+    """Assert that two dataframes hold the same values, ignoring dtype width.
+
+    A lighter alternative to assert_frame_equal(check_dtype=False) for frames
+    whose column order and value types are known to match: each column is
+    compared as a NumPy array in one array_equal call.
+
+    Args:
+        expected: The dataframe with the expected values
+        actual: The dataframe to check
+    """
+    assert list(actual.columns) == list(expected.columns)
+    assert len(actual) == len(expected)
+    for col in expected.columns:
+        left = expected[col].to_numpy()
+        right = actual[col].to_numpy()
+        floats = left.dtype.kind == "f" and right.dtype.kind == "f"
+        assert np.array_equal(left, right, equal_nan=floats), f"column {col} differs"
+
+
+def assert_arrow_equal(expected: pd.DataFrame, actual: pd.DataFrame):
+    """Assert that two dataframes hold the same data, compared as Arrow tables.
+
+    Both frames are converted without their index and compared in one Arrow
+    equality check, ignoring schema metadata. The actual table is cast to the
+    expected schema first, so string and large_string columns compare equal.
+
+    Args:
+        expected: The dataframe with the expected values
+        actual: The dataframe to check
+    """
+    import pyarrow as pa
+
+    expected_table = pa.Table.from_pandas(expected, preserve_index=False)
+    actual_table = pa.Table.from_pandas(actual, preserve_index=False)
+    assert actual_table.cast(expected_table.schema).equals(
+        expected_table, check_metadata=False
+    ), "dataframes differ"
+
+
+def write_json(path, obj):
+    """Write an object as JSON with the same encoder daflip uses.
+
+    Args:
+        path: Path to the output JSON file
+        obj: The object to serialize
+    """
+    from src.daflip.services import _json_dumps
+
+    Path(path).write_bytes(_json_dumps(obj))
+
+
+def read_json(path):
+    """Read a JSON file with the same decoder daflip uses.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded object
+    """
+    from src.daflip.services import _json_loads
+
+    return _json_loads(Path(path).read_bytes())
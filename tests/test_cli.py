@@ -8,6 +8,7 @@ of the daflip package.
 from typer.testing import CliRunner
 
 from src.daflip.cli import app
+from tests.helpers import write_json
 
 
 def test_cli_runs():
@@ -316,8 +317,6 @@ def test_cli_convert_with_schema_file(tmp_path):
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    import json
-
     import pandas as pd
 
     # Create schema file
@@ -325,8 +324,7 @@ def test_cli_convert_with_schema_file(tmp_path):
         "fields": [{"name": "a", "type": "int64"}, {"name": "b", "type": "string"}]
     }
     schema_file = tmp_path / "schema.json"
-    with open(schema_file, "w") as f:
-        json.dump(schema_data, f)
+    write_json(schema_file, schema_data)
 
     # Create test data
     df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
@@ -6,11 +6,22 @@ functionality in the daflip package.
 """
 
 import os
+from collections.abc import Mapping
 from unittest.mock import patch
 
+import pytest
+
 from src.daflip.config import get_config
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Reset the memoized configuration so each test reloads it."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
 def test_get_config_default():
     """Test default configuration values.
 
@@ -20,7 +31,7 @@ def test_get_config_default():
     with patch.dict(os.environ, {}, clear=True):
         config = get_config()
 
-        assert isinstance(config, dict)
+        assert isinstance(config, Mapping)
         assert "LOG_LEVEL" in config
         assert config["LOG_LEVEL"] == "INFO"
 
@@ -128,7 +139,7 @@ def test_get_config_structure():
     config = get_config()
 
     # Check structure
-    assert isinstance(config, dict)
+    assert isinstance(config, Mapping)
     assert "LOG_LEVEL" in config
     assert isinstance(config["LOG_LEVEL"], str)
 
@@ -138,23 +149,40 @@ def test_get_config_structure():
 
 
 def test_get_config_immutable():
-    """Test that configuration is not affected by external changes.
+    """Test that configuration cannot be modified by callers.
 
-    This test verifies that modifying the returned configuration
-    doesn't affect subsequent calls to get_config.
+    This test verifies that the returned configuration is read-only, so
+    the memoized value shared between callers cannot be changed.
     """
     config1 = get_config()
     original_level = config1["LOG_LEVEL"]
 
-    # Modify the returned config
-    config1["LOG_LEVEL"] = "MODIFIED"
+    # Modifying the returned config is rejected
+    with pytest.raises(TypeError):
+        config1["LOG_LEVEL"] = "MODIFIED"
 
     # Get config again
     config2 = get_config()
 
-    # Second call should return original value
     assert config2["LOG_LEVEL"] == original_level
-    assert config1["LOG_LEVEL"] == "MODIFIED"  # First config was modified
+
+
+def test_get_config_cached():
+    """Test that configuration is only loaded once per process.
+
+    This test verifies that repeated calls reuse the first result and do
+    not parse the .env file again until the cache is cleared.
+    """
+    with patch("src.daflip.config.load_dotenv") as mock_load_dotenv:
+        config1 = get_config()
+        config2 = get_config()
+
+        assert config1 is config2
+        assert mock_load_dotenv.call_count == 1
+
+        get_config.cache_clear()
+        get_config()
+        assert mock_load_dotenv.call_count == 2
 
 
 def test_get_config_multiple_calls():
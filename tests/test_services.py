@@ -5,309 +5,529 @@ This module contains comprehensive tests for the data conversion services,
 including format roundtrip tests, edge cases, and error handling.
 """
 
+import importlib.util
+import io
 import json
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
-from src.daflip.services import convert_data, infer_and_export_schema
+from src.daflip import services
+from src.daflip.services import convert_data, convert_many, infer_and_export_schema
+from tests.helpers import assert_frame_values_equal, read_json, write_json
+
+# Readers for the output formats checked by the roundtrip tests
+OUTPUT_READERS = {
+    "csv": pd.read_csv,
+    "parquet": pd.read_parquet,
+    "feather": pd.read_feather,
+}
 
 
 @pytest.mark.parametrize(
-    "fmt,ext,read_func,write_func",
+    "fmt,out_fmt",
     [
-        ("csv", ".csv", pd.read_csv, pd.DataFrame.to_csv),
-        ("parquet", ".parquet", pd.read_parquet, pd.DataFrame.to_parquet),
-        ("feather", ".feather", pd.read_feather, pd.DataFrame.to_feather),
+        ("csv", "csv"),
+        ("parquet", "parquet"),
+        ("feather", "feather"),
+        ("tsv", "csv"),
+        ("psv", "csv"),
+        ("orc", "csv"),
+        # Skip Excel and Stata due to dependency issues in test environment
+        # ("excel", "csv"),
+        # ("stata", "csv"),
     ],
+    ids=["csv", "parquet", "feather", "tsv", "psv", "orc"],
 )
-def test_convert_roundtrip(fmt, ext, read_func, write_func, tmp_path):
+def test_convert_roundtrip(fmt, out_fmt, tmp_path, tiny_df, tiny_bytes):
     """Test roundtrip conversion between different formats.
 
     This test verifies that data can be converted from one format to another
-    and back without loss of information. It creates a simple DataFrame,
-    writes it to a file, converts it to another format, and then verifies
-    that the data is preserved.
+    and back without loss of information. It writes a simple DataFrame to a
+    file, converts it, and then verifies that the data is preserved. Formats
+    without a dedicated reader check are converted to CSV.
 
     Args:
-        fmt: Format identifier (e.g., "csv", "parquet")
-        ext: File extension (e.g., ".csv", ".parquet")
-        read_func: Function to read the format
-        write_func: Function to write the format
+        fmt: Input format identifier (e.g., "csv", "parquet")
+        out_fmt: Output format identifier
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
+        tiny_bytes: Session fixture with the tiny frame's encoded files
     """
-    # Create a simple DataFrame
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / f"input{ext}"
-    output_file = tmp_path / f"output{ext}"
+    input_file = tmp_path / f"input.{fmt}"
+    output_file = tmp_path / f"output.{out_fmt}"
     # Write input file
-    if fmt == "csv":
-        df.to_csv(input_file, index=False)
-    elif fmt == "parquet":
-        df.to_parquet(input_file, index=False)
-    elif fmt == "feather":
-        df.to_feather(input_file)
+    input_file.write_bytes(tiny_bytes[fmt])
     # Convert
     convert_data(str(input_file), str(output_file))
     # Read output and compare
-    df2 = read_func(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    df2 = OUTPUT_READERS[out_fmt](output_file)
+    assert_frame_values_equal(tiny_df, df2)
 
 
 @pytest.mark.parametrize(
-    "fmt,ext,read_func,write_func",
-    [
-        ("tsv", ".tsv", pd.read_csv, pd.DataFrame.to_csv),
-        ("psv", ".psv", pd.read_csv, pd.DataFrame.to_csv),
-        ("orc", ".orc", pd.read_orc, pd.DataFrame.to_orc),
-        # Skip Excel and Stata due to dependency issues in test environment
-        # ("excel", ".xlsx", pd.read_excel, pd.DataFrame.to_excel),
-        # ("stata", ".dta", pd.read_stata, pd.DataFrame.to_stata),
-    ],
+    "fmt,input_chunk_size",
+    [("csv", None), ("csv", 2), ("parquet", None), ("feather", None)],
+    ids=["csv", "csv_chunked", "parquet", "feather"],
 )
-def test_convert_additional_formats(fmt, ext, read_func, write_func, tmp_path):
-    """Test conversion for additional supported formats.
+def test_convert_to_csv_matches_pandas(tmp_path, fmt, input_chunk_size):
+    """Test that CSV output is byte for byte what pandas' to_csv writes.
+
+    Quoting, booleans, float and timestamp formatting and missing values
+    must not change with the input format or with chunked processing.
 
     Args:
-        fmt: Format identifier
-        ext: File extension
-        read_func: Function to read the format
-        write_func: Function to write the format
         tmp_path: Pytest fixture providing temporary directory
+        fmt: The input format
+        input_chunk_size: Rows per chunk (None for a non-chunked conversion)
     """
-    # Create a simple DataFrame
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / f"input{ext}"
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["row_0", 'a, "b"', None],
+            "flag": [True, False, True],
+            "x": [1.0, 2.5, None],
+            "ts": pd.to_datetime(
+                ["2024-01-01 10:00:00", "2024-01-02 00:00:00", "2024-01-03 00:00:00"]
+            ),
+        }
+    )
+    expected = df.to_csv(index=False).encode()
+    input_file = tmp_path / f"input.{fmt}"
+    if fmt == "csv":
+        input_file.write_bytes(expected)
+    elif fmt == "parquet":
+        df.to_parquet(input_file, index=False)
+    else:
+        df.to_feather(input_file)
     output_file = tmp_path / "output.csv"
 
-    # Write input file with appropriate parameters
-    if fmt == "tsv":
-        df.to_csv(input_file, sep="\t", index=False)
-    elif fmt == "psv":
-        df.to_csv(input_file, sep="|", index=False)
-    elif fmt == "orc":
-        df.to_orc(input_file, index=False)
-    # Skip Excel and Stata due to dependency issues
-    # elif fmt == "excel":
-    #     df.to_excel(input_file, index=False)
-    # elif fmt == "stata":
-    #     df.to_stata(input_file)
-
-    # Convert to CSV
-    convert_data(str(input_file), str(output_file))
+    convert_data(str(input_file), str(output_file), input_chunk_size=input_chunk_size)
 
-    # Read back and verify
-    df_result = pd.read_csv(output_file)
-    pd.testing.assert_frame_equal(df, df_result, check_dtype=False)
+    assert output_file.read_bytes() == expected
 
 
-def test_convert_with_compression(tmp_path):
+def test_convert_with_compression(tmp_path, tiny_df, tiny_bytes):
     """Test conversion with compression options.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
+        tiny_bytes: Session fixture with the tiny frame's encoded files
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df = tiny_df
     input_file = tmp_path / "input.csv"
     output_file = tmp_path / "output.parquet"
 
-    df.to_csv(input_file, index=False)
+    input_file.write_bytes(tiny_bytes["csv"])
 
     # Test with compression
     convert_data(str(input_file), str(output_file), compression="snappy")
 
     # Verify file was created and can be read
     df2 = pd.read_parquet(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(df, df2)
 
 
-def test_convert_with_compression_level(tmp_path):
+def test_convert_with_compression_level(tmp_path, tiny_df, tiny_bytes):
     """Test conversion with compression level settings.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
+        tiny_bytes: Session fixture with the tiny frame's encoded files
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df = tiny_df
     input_file = tmp_path / "input.csv"
     output_file = tmp_path / "output.parquet"
 
-    df.to_csv(input_file, index=False)
+    input_file.write_bytes(tiny_bytes["csv"])
 
     # Test with compression and compression level
     convert_data(
-        str(input_file), str(output_file), compression="gzip", compression_level=6
+        str(input_file), str(output_file), compression="gzip", compression_level=1
     )
 
     # Verify file was created and can be read
     df2 = pd.read_parquet(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(df, df2)
 
 
-def test_chunked_conversion_csv_to_csv(tmp_path):
-    """Test chunked conversion from CSV to CSV.
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_chunked_conversion(tmp_path, medium_df, medium_csv_bytes, suffix):
+    """Test chunked conversion from CSV to CSV and to Parquet.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        medium_df: Session fixture with the 100-row dataframe
+        medium_csv_bytes: Session fixture with that dataframe encoded as CSV
+        suffix: Output file extension
     """
-    # Create a larger DataFrame for chunked processing
-    df = pd.DataFrame({"a": range(100), "b": [f"row_{i}" for i in range(100)]})
     input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.csv"
+    output_file = tmp_path / f"output{suffix}"
 
-    df.to_csv(input_file, index=False)
+    input_file.write_bytes(medium_csv_bytes)
 
     # Convert with chunking
     convert_data(str(input_file), str(output_file), input_chunk_size=25)
 
     # Verify result
-    df2 = pd.read_csv(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    reader = pd.read_csv if suffix == ".csv" else pd.read_parquet
+    assert_frame_values_equal(medium_df, reader(output_file))
 
 
-def test_chunked_conversion_csv_to_parquet(tmp_path):
-    """Test chunked conversion from CSV to Parquet.
+@pytest.mark.parametrize(
+    "fmt,input_chunk_size",
+    [("csv", 100), ("csv", None), ("tsv", None)],
+    ids=["csv_chunked", "csv", "tsv"],
+)
+def test_conversion_widens_late_types(tmp_path, monkeypatch, fmt, input_chunk_size):
+    """Test that streamed CSV reads widen columns whose type changes late.
+
+    Column types are inferred from the first block, so values that only
+    appear in later blocks must widen the column instead of failing, in
+    chunked conversions and in plain delimited text to Parquet transcodes.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        monkeypatch: Pytest fixture for shrinking the CSV block size
+        fmt: Input format (csv or tsv)
+        input_chunk_size: Chunk size, or None for a non-chunked conversion
     """
-    # Create a larger DataFrame for chunked processing
-    df = pd.DataFrame({"a": range(100), "b": [f"row_{i}" for i in range(100)]})
-    input_file = tmp_path / "input.csv"
+    monkeypatch.setattr(services, "ARROW_CSV_BLOCK_SIZE", 1 << 10)
+    sep = "\t" if fmt == "tsv" else ","
+    rows = [("a", "b", "c"), *((str(i), str(i), "") for i in range(999))]
+    lines = [sep.join(row) for row in [*rows, ("1.5", "x", "z")]]
+    input_file = tmp_path / f"input.{fmt}"
+    input_file.write_text("\n".join(lines) + "\n")
     output_file = tmp_path / "output.parquet"
 
-    df.to_csv(input_file, index=False)
+    convert_data(str(input_file), str(output_file), input_chunk_size=input_chunk_size)
 
-    # Convert with chunking
-    convert_data(str(input_file), str(output_file), input_chunk_size=25)
+    table = pq.read_table(output_file)
+    assert table.schema.types == [pa.float64(), pa.string(), pa.string()]
+    assert table.column("a").to_pylist()[-2:] == [998.0, 1.5]
+    assert table.column("b").to_pylist()[-2:] == ["998", "x"]
+    assert table.column("c").to_pylist()[-2:] == [None, "z"]
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+def test_chunked_conversion_header_only(tmp_path, suffix):
+    """Test that a CSV without data rows still produces an output file.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        suffix: Output file extension
+    """
+    input_file = tmp_path / "input.csv"
+    output_file = tmp_path / f"output{suffix}"
+    input_file.write_text("a,b\n")
+
+    convert_data(str(input_file), str(output_file), input_chunk_size=10)
+
+    reader = pd.read_csv if suffix == ".csv" else pd.read_parquet
+    df = reader(output_file)
+    assert df.columns.tolist() == ["a", "b"]
+    assert df.empty
+
+
+def test_chunked_conversion_auto_chunk_size(tmp_path, medium_df, medium_csv_bytes):
+    """Test chunked conversion with an automatically sized chunk.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        medium_df: Session fixture with the 100-row dataframe
+        medium_csv_bytes: Session fixture with that dataframe encoded as CSV
+    """
+    input_file = tmp_path / "input.csv"
+    output_file = tmp_path / "output.parquet"
+    input_file.write_bytes(medium_csv_bytes)
+
+    convert_data(str(input_file), str(output_file), input_chunk_size=0)
 
-    # Verify result
     df2 = pd.read_parquet(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(medium_df, df2)
 
 
-def test_chunked_conversion_validation(tmp_path):
+def test_chunked_conversion_validation(tmp_path, tiny_bytes):
     """Test chunking validation for unsupported formats.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_bytes: Session fixture with the tiny frame's encoded files
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
     input_file = tmp_path / "input.parquet"
     output_file = tmp_path / "output.csv"
 
-    df.to_parquet(input_file, index=False)
+    input_file.write_bytes(tiny_bytes["parquet"])
 
     # Test that chunked reading raises error for unsupported format
     with pytest.raises(NotImplementedError, match="Chunked reading is not supported"):
         convert_data(str(input_file), str(output_file), input_chunk_size=1000)
 
 
-def test_convert_row_selection(tmp_path):
+@pytest.fixture(scope="module")
+def rowsel_csv(tmp_path_factory):
+    """Ten-row single-column CSV shared by the row selection cases.
+
+    Args:
+        tmp_path_factory: Pytest fixture creating session temporary directories
+
+    Returns:
+        Path to the CSV file
+    """
+    path = tmp_path_factory.mktemp("row_selection") / "input.csv"
+    pd.DataFrame({"a": range(10)}).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize(
+    "rows,expected",
+    [
+        ("2:5", [2, 3, 4]),
+        ("invalid", list(range(10))),  # ignored: all rows are converted
+        ("10:20", []),
+        ("3:3", []),
+    ],
+    ids=["window", "invalid_format", "out_of_bounds", "empty_result"],
+)
+def test_convert_row_selection(tmp_path, rowsel_csv, rows, expected):
     """Test row selection functionality during conversion.
 
-    This test verifies that the row selection feature works correctly
-    by converting only a subset of rows from the input file.
+    This test verifies that the row selection feature converts only the
+    selected subset of rows, ignores a malformed selection, and produces an
+    empty output for windows past the end or of zero length.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        rowsel_csv: Module fixture with the ten-row input CSV
+        rows: Row selection passed to convert_data
+        expected: Values of column "a" expected in the output
     """
-    df = pd.DataFrame({"a": range(10)})
-    input_file = tmp_path / "input.csv"
     output_file = tmp_path / "output.csv"
-    df.to_csv(input_file, index=False)
-    convert_data(str(input_file), str(output_file), rows="2:5")
+    convert_data(str(rowsel_csv), str(output_file), rows=rows)
     df2 = pd.read_csv(output_file)
-    assert df2.shape[0] == 3
-    assert df2["a"].tolist() == [2, 3, 4]
+    assert df2.shape[0] == len(expected)
+    assert df2["a"].tolist() == expected
 
 
-def test_row_selection_invalid_format(tmp_path):
-    """Test row selection with invalid format.
+def test_convert_row_selection_arrow_native(tmp_path):
+    """Test row selection on the Arrow-native CSV to Parquet path.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": range(10)})
+    df = pd.DataFrame({"a": range(10), "b": [f"row_{i}" for i in range(10)]})
     input_file = tmp_path / "input.csv"
+    output_file = tmp_path / "output.parquet"
+    df.to_csv(input_file, index=False)
+    convert_data(str(input_file), str(output_file), rows="-3:20")
+    df2 = pd.read_parquet(output_file)
+    assert df2["a"].tolist() == [7, 8, 9]
+    assert df2["b"].tolist() == ["row_7", "row_8", "row_9"]
+
+
+def test_convert_row_selection_pushdown(tmp_path):
+    """Test that a row window is pushed down into the pandas-path read.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": range(100)})
+    input_file = tmp_path / "input.parquet"
     output_file = tmp_path / "output.csv"
+    df.to_parquet(input_file, index=False)
 
-    df.to_csv(input_file, index=False)
+    convert_data(str(input_file), str(output_file), rows="10:15")
+    assert pd.read_csv(output_file)["a"].tolist() == [10, 11, 12, 13, 14]
 
-    # Test invalid row format - should continue without row selection
-    convert_data(str(input_file), str(output_file), rows="invalid")
+    convert_data(str(input_file), str(output_file), rows="-2:100")
+    assert pd.read_csv(output_file)["a"].tolist() == [98, 99]
 
-    # Should convert all rows
-    df2 = pd.read_csv(output_file)
-    assert df2.shape[0] == 10
+
+def test_convert_tsv_to_parquet_streamed_window(tmp_path, medium_df):
+    """Test streaming delimited text to Parquet with a row window.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        medium_df: Session fixture with the 100-row dataframe
+    """
+    input_file = tmp_path / "input.tsv"
+    output_file = tmp_path / "output.parquet"
+    medium_df.to_csv(input_file, sep="\t", index=False)
+
+    convert_data(str(input_file), str(output_file), rows="40:43", columns=["b"])
+
+    df2 = pd.read_parquet(output_file)
+    assert df2.columns.tolist() == ["b"]
+    assert df2["b"].tolist() == ["row_40", "row_41", "row_42"]
 
 
-def test_row_selection_out_of_bounds(tmp_path):
-    """Test row selection with out-of-bounds indices.
+def test_convert_parquet_passthrough(tmp_path):
+    """Test that an unchanged Parquet to Parquet conversion copies the file.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": range(5)})
-    input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.csv"
+    input_file = tmp_path / "input.parquet"
+    output_file = tmp_path / "output.parquet"
+    pd.DataFrame({"a": range(10)}).to_parquet(input_file, compression="gzip")
 
-    df.to_csv(input_file, index=False)
+    convert_data(str(input_file), str(output_file))
+    assert output_file.read_bytes() == input_file.read_bytes()
 
-    # Test out-of-bounds selection
-    convert_data(str(input_file), str(output_file), rows="10:20")
+    # Converting a file onto itself leaves it untouched
+    convert_data(str(input_file), str(input_file))
+    assert pd.read_parquet(input_file)["a"].tolist() == list(range(10))
 
-    # Should result in empty dataframe
-    df2 = pd.read_csv(output_file)
-    assert df2.shape[0] == 0
 
+def test_convert_parquet_transcode(tmp_path):
+    """Test streaming Parquet to Parquet recompression.
 
-def test_row_selection_empty_result(tmp_path):
-    """Test row selection that results in empty dataframe.
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": range(200_000), "b": ["x", "y"] * 100_000})
+    input_file = tmp_path / "input.parquet"
+    output_file = tmp_path / "output.parquet"
+    df.to_parquet(input_file, index=False, compression="snappy")
+
+    convert_data(str(input_file), str(output_file), compression="zstd")
+
+    assert pq.read_table(output_file).equals(pq.read_table(input_file))
+    metadata = pq.ParquetFile(output_file).metadata
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_convert_many(tmp_path):
+    """Test converting several files in worker processes.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": range(5)})
-    input_file = tmp_path / "input.csv"
-    output_file = tmp_path / "output.csv"
+    jobs = []
+    for i in range(3):
+        input_file = tmp_path / f"input{i}.csv"
+        pd.DataFrame({"a": [i, i + 1]}).to_csv(input_file, index=False)
+        jobs.append((str(input_file), str(tmp_path / f"output{i}.parquet")))
 
-    df.to_csv(input_file, index=False)
+    convert_many(jobs, max_workers=2, compression="zstd")
 
-    # Test selection that results in empty result
-    convert_data(str(input_file), str(output_file), rows="3:3")
+    for i, (_, output_file) in enumerate(jobs):
+        assert pd.read_parquet(output_file)["a"].tolist() == [i, i + 1]
 
-    # Should result in empty dataframe
-    df2 = pd.read_csv(output_file)
-    assert df2.shape[0] == 0
 
+@pytest.mark.parametrize("suffix,compression", [(".csv", "gzip"), (".orc", "zstd")])
+def test_convert_ignores_unsupported_compression_level(tmp_path, suffix, compression):
+    """Test that a compression level is ignored by writers without one.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        suffix: Output file extension
+        compression: Compression type supported by the output format
+    """
+    input_file = tmp_path / "input.parquet"
+    output_file = tmp_path / f"output{suffix}"
+    pd.DataFrame({"a": [1, 2, 3]}).to_parquet(input_file, index=False)
+
+    convert_data(
+        str(input_file),
+        str(output_file),
+        compression=compression,
+        compression_level=3,
+    )
+
+    if suffix == ".csv":
+        df = pd.read_csv(output_file, compression=compression)
+    else:
+        df = pd.read_orc(output_file)
+    assert df["a"].tolist() == [1, 2, 3]
+
+
+def test_convert_column_selection(tmp_path):
+    """Test column selection on the Arrow-native and pandas paths.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": range(10), "b": range(10), "c": range(10)})
+    input_file = tmp_path / "input.parquet"
+    df.to_parquet(input_file, index=False)
+
+    arrow_output = tmp_path / "output.feather"
+    convert_data(str(input_file), str(arrow_output), rows="2:4", columns=["c", "a"])
+    df2 = pd.read_feather(arrow_output)
+    assert df2.columns.tolist() == ["c", "a"]
+    assert df2["a"].tolist() == [2, 3]
+
+    pandas_output = tmp_path / "output.csv"
+    convert_data(str(input_file), str(pandas_output), columns=["b"])
+    assert pd.read_csv(pandas_output).columns.tolist() == ["b"]
 
-def test_convert_with_schema_file(tmp_path):
+
+def test_convert_with_schema_file(tmp_path, tiny_df, tiny_bytes):
     """Test conversion with custom schema file.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
+        tiny_bytes: Session fixture with the tiny frame's encoded files
     """
     # Create schema file
     schema_data = {
         "fields": [{"name": "a", "type": "int64"}, {"name": "b", "type": "string"}]
     }
     schema_file = tmp_path / "schema.json"
-    with open(schema_file, "w") as f:
-        json.dump(schema_data, f)
+    write_json(schema_file, schema_data)
 
     # Create input data
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df = tiny_df
     input_file = tmp_path / "input.csv"
     output_file = tmp_path / "output.parquet"
 
-    df.to_csv(input_file, index=False)
+    input_file.write_bytes(tiny_bytes["csv"])
 
     # Convert with schema
     convert_data(str(input_file), str(output_file), schema_file=str(schema_file))
 
     # Verify result
     df2 = pd.read_parquet(output_file)
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(df, df2)
+
+
+def test_convert_with_in_memory_schema(tmp_path, tiny_df, tiny_bytes):
+    """Test conversion with a schema dictionary instead of a schema file.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
+        tiny_bytes: Session fixture with the tiny frame's encoded files
+    """
+    schema_data = {
+        "fields": [{"name": "a", "type": "int32"}, {"name": "b", "type": "string"}]
+    }
+    df = tiny_df
+    input_file = tmp_path / "input.csv"
+    output_file = tmp_path / "output.parquet"
+    input_file.write_bytes(tiny_bytes["csv"])
+
+    convert_data(str(input_file), str(output_file), schema=schema_data)
+
+    assert pq.read_schema(output_file).field("a").type == pa.int32()
+    assert_frame_values_equal(df, pd.read_parquet(output_file))
+
+    # A schema and a schema file cannot be combined
+    schema_file = tmp_path / "schema.json"
+    write_json(schema_file, schema_data)
+    with pytest.raises(ValueError, match="either schema or schema_file"):
+        convert_data(
+            str(input_file),
+            str(output_file),
+            schema_file=str(schema_file),
+            schema=schema_data,
+        )
 
 
 def test_schema_file_not_found(tmp_path):
@@ -348,43 +568,40 @@ def test_schema_file_invalid_json(tmp_path):
         convert_data(str(input_file), str(output_file), schema_file=str(schema_file))
 
 
-def test_convert_excel_with_sheet_name(tmp_path):
+def test_convert_excel_with_sheet_name(tmp_path, tiny_df, excel_two_sheets_bytes):
     """Test Excel conversion with specific sheet.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe (stored on Sheet1)
+        excel_two_sheets_bytes: Session fixture with a two-sheet workbook
     """
-    # Create Excel file with multiple sheets
-    df1 = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    df2 = pd.DataFrame({"c": [4, 5, 6], "d": ["a", "b", "c"]})
-
+    # Excel file with multiple sheets
+    df1 = tiny_df
     input_file = tmp_path / "input.xlsx"
     output_file = tmp_path / "output.csv"
 
-    with pd.ExcelWriter(input_file) as writer:
-        df1.to_excel(writer, sheet_name="Sheet1", index=False)
-        df2.to_excel(writer, sheet_name="Sheet2", index=False)
+    input_file.write_bytes(excel_two_sheets_bytes)
 
     # Convert specific sheet
     convert_data(str(input_file), str(output_file), sheet_name="Sheet1")
 
     # Verify correct sheet was converted
     df_result = pd.read_csv(output_file)
-    pd.testing.assert_frame_equal(df1, df_result, check_dtype=False)
+    assert_frame_values_equal(df1, df_result)
 
 
-def test_convert_excel_invalid_sheet(tmp_path):
+def test_convert_excel_invalid_sheet(tmp_path, excel_two_sheets_bytes):
     """Test Excel conversion with invalid sheet name.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        excel_two_sheets_bytes: Session fixture with a two-sheet workbook
     """
-
-    df = pd.DataFrame({"a": [1, 2, 3]})
     input_file = tmp_path / "input.xlsx"
     output_file = tmp_path / "output.csv"
 
-    df.to_excel(input_file, index=False)
+    input_file.write_bytes(excel_two_sheets_bytes)
 
     # Should raise an error for invalid sheet
     with pytest.raises(Exception):
@@ -473,8 +690,7 @@ def test_schema_inference_csv(tmp_path):
     infer_and_export_schema(str(input_file), None, str(schema_file))
 
     # Verify schema file was created and has correct structure
-    with open(schema_file, "r") as f:
-        schema_data = json.load(f)
+    schema_data = read_json(schema_file)
 
     assert "fields" in schema_data
     field_names = [f["name"] for f in schema_data["fields"]]
@@ -498,8 +714,7 @@ def test_schema_inference_parquet(tmp_path):
     infer_and_export_schema(str(input_file), None, str(schema_file))
 
     # Verify schema file was created
-    with open(schema_file, "r") as f:
-        schema_data = json.load(f)
+    schema_data = read_json(schema_file)
 
     assert "fields" in schema_data
     assert len(schema_data["fields"]) == 2
@@ -522,8 +737,7 @@ def test_schema_inference_with_nrows(tmp_path):
     infer_and_export_schema(str(input_file), None, str(schema_file), nrows=100)
 
     # Verify schema file was created
-    with open(schema_file, "r") as f:
-        schema_data = json.load(f)
+    schema_data = read_json(schema_file)
 
     assert "fields" in schema_data
     assert len(schema_data["fields"]) == 2
@@ -541,11 +755,12 @@ def test_schema_export_format(tmp_path):
 
     df.to_csv(input_file, index=False)
 
-    infer_and_export_schema(str(input_file), None, str(schema_file))
+    returned = infer_and_export_schema(str(input_file), None, str(schema_file))
 
     # Verify JSON structure
-    with open(schema_file, "r") as f:
-        schema_data = json.load(f)
+    schema_data = read_json(schema_file)
+
+    assert returned == schema_data
 
     assert isinstance(schema_data, dict)
     assert "fields" in schema_data
@@ -558,13 +773,50 @@ def test_schema_export_format(tmp_path):
         assert isinstance(field["type"], str)
 
 
-@pytest.mark.skipif(
-    not (
-        pytest.importorskip("xlrd", reason="xlrd required for .xls")
-        and pytest.importorskip("xlwt", reason="xlwt required for .xls")
-    ),
-    reason="xlrd and xlwt required for .xls support",
-)
+def test_schema_roundtrip_with_dates(tmp_path):
+    """Test that a schema inferred from a CSV with dates can be used to convert it.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    input_file = tmp_path / "input.csv"
+    input_file.write_text(
+        "id,day,ts,name\n"
+        "1,2024-01-01,2024-01-01 10:00:00,a\n"
+        "2,2024-01-02,2024-01-02 11:30:00,b\n"
+    )
+    schema_file = tmp_path / "schema.json"
+    output_file = tmp_path / "output.parquet"
+
+    exported = infer_and_export_schema(str(input_file), None, str(schema_file))
+    convert_data(str(input_file), str(output_file), schema_file=str(schema_file))
+
+    types = {field["name"]: field["type"] for field in exported["fields"]}
+    assert types["day"] == "date32[day]"
+    assert types["ts"] == "timestamp[s]"
+    schema = pq.read_schema(output_file)
+    assert schema.field("day").type == pa.date32()
+    assert pa.types.is_timestamp(schema.field("ts").type)  # Parquet has no s unit
+
+
+@pytest.fixture(scope="module")
+def requires_xls():
+    """Skip unless .xls files can be both read and written.
+
+    The engines are probed when a test needs them rather than at collection
+    time. pandas 2 dropped its xlwt writer, so an installed xlwt is not
+    enough: the writer itself must be available.
+    """
+    if importlib.util.find_spec("xlrd") is None:
+        pytest.skip("xlrd required for reading .xls files")
+    try:
+        pd.ExcelWriter(io.BytesIO(), engine="xlwt")
+    except (ImportError, ValueError) as e:
+        pytest.skip(f"no .xls writer available: {e}")
+
+
+@pytest.mark.usefixtures("requires_xls")
+@pytest.mark.slow
 def test_convert_xls_roundtrip(tmp_path):
     """Test roundtrip conversion for .xls format."""
     df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
@@ -576,16 +828,11 @@ def test_convert_xls_roundtrip(tmp_path):
     convert_data(str(input_file), str(output_file))
     # Read output and compare
     df2 = pd.read_excel(output_file, engine="xlrd")
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(df, df2)
 
 
-@pytest.mark.skipif(
-    not (
-        pytest.importorskip("xlrd", reason="xlrd required for .xls")
-        and pytest.importorskip("xlwt", reason="xlwt required for .xls")
-    ),
-    reason="xlrd and xlwt required for .xls support",
-)
+@pytest.mark.usefixtures("requires_xls")
+@pytest.mark.slow
 def test_convert_xls_with_sheet_name(tmp_path):
     """Test .xls conversion with a specific sheet name."""
     df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
@@ -597,4 +844,4 @@ def test_convert_xls_with_sheet_name(tmp_path):
     convert_data(str(input_file), str(output_file), sheet_name="MySheet")
     # Read output and compare
     df2 = pd.read_excel(output_file, sheet_name="MySheet", engine="xlrd")
-    pd.testing.assert_frame_equal(df, df2, check_dtype=False)
+    assert_frame_values_equal(df, df2)
@@ -5,48 +5,61 @@ This module contains unit tests for the internal helper functions
 that support the main data conversion functionality.
 """
 
+import io
 import json
 
 import pandas as pd
 import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import pytest
+from rich.console import Console
 
+from src.daflip import services
 from src.daflip.services import (
     _apply_row_selection,
+    _arrow_to_pandas,
+    _autotune_chunk_size,
     _build_read_kwargs,
     _build_write_kwargs,
     _convert_dtypes,
+    _create_arrow_chunked_reader,
     _create_chunked_reader,
     _export_schema_to_json,
+    _from_pandas_nthreads,
     _get_schema_from_arrow_format,
     _get_schema_from_pandas_format,
     _load_schema,
+    _open_chunk_writer,
+    _open_input,
+    _parquet_row_group_size,
+    _prefetch_chunks,
+    _pushdown_rows,
+    _read_arrow_table,
     _read_dataframe,
+    _resolve_chunk_schema,
+    _show_preview,
     _validate_chunking_support,
+    _window_batches,
     _write_chunk_csv,
     _write_chunk_parquet,
     _write_dataframe,
 )
+from tests.helpers import (
+    assert_arrow_equal,
+    assert_roundtrip_equal,
+    read_json,
+    write_json,
+)
 
 
-def test_load_schema_valid_file(tmp_path):
+def test_load_schema_valid_file(valid_schema_file):
     """Test loading valid schema from JSON file.
 
     Args:
-        tmp_path: Pytest fixture providing temporary directory
+        valid_schema_file: Session fixture with a valid schema file
     """
-    # Create valid schema file
-    schema_data = {
-        "fields": [
-            {"name": "col1", "type": "int64"},
-            {"name": "col2", "type": "string"},
-        ]
-    }
-    schema_file = tmp_path / "schema.json"
-    with open(schema_file, "w") as f:
-        json.dump(schema_data, f)
-
-    schema = _load_schema(str(schema_file))
+    schema = _load_schema(valid_schema_file)
     assert schema is not None
     assert len(schema) == 2
     assert schema.field(0).name == "col1"
@@ -68,6 +81,49 @@ def test_load_schema_invalid_file(tmp_path):
         _load_schema(str(schema_file))
 
 
+def test_load_schema_unsupported_type(tmp_path):
+    """Test that unknown field types are rejected.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    schema_data = {
+        "fields": [
+            {"name": "col1", "type": "int64"},
+            {"name": "col2", "type": "decimal"},
+        ]
+    }
+    schema_file = tmp_path / "schema.json"
+    write_json(schema_file, schema_data)
+
+    with pytest.raises(ValueError, match="Unsupported type: decimal"):
+        _load_schema(str(schema_file))
+
+
+def test_load_schema_pyarrow_type_names(tmp_path):
+    """Test that type names as printed by pyarrow are accepted.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    types = {
+        "date32[day]": pa.date32(),
+        "timestamp[s]": pa.timestamp("s"),
+        "timestamp[us, tz=UTC]": pa.timestamp("us", tz="UTC"),
+        "large_string": pa.large_string(),
+        "float": pa.float32(),
+    }
+    schema_file = tmp_path / "schema.json"
+    write_json(
+        schema_file,
+        {"fields": [{"name": f"c{i}", "type": name} for i, name in enumerate(types)]},
+    )
+
+    schema = _load_schema(str(schema_file))
+
+    assert schema.types == list(types.values())
+
+
 def test_load_schema_file_not_found(tmp_path):
     """Test error handling for missing schema file.
 
@@ -102,24 +158,34 @@ def test_validate_chunking_support_invalid_output():
         _validate_chunking_support("csv", "feather", None, 1000)
 
 
-def test_create_chunked_reader_csv(tmp_path):
-    """Test creating chunked reader for CSV.
+def test_create_arrow_chunked_reader(tmp_path):
+    """Test creating an Arrow record batch reader for CSV.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    # Create test CSV file
-    df = pd.DataFrame({"a": range(10), "b": [f"row_{i}" for i in range(10)]})
+    table = pa.table({"a": range(10), "b": [f"row_{i}" for i in range(10)]})
     input_file = tmp_path / "input.csv"
-    df.to_csv(input_file, index=False)
+    pacsv.write_csv(table, str(input_file))
+
+    batches = list(_create_arrow_chunked_reader(str(input_file), 3))
 
-    reader = _create_chunked_reader(str(input_file), "csv", 3, None)
+    assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+    assert [batch.num_rows for batch in batches] == [3, 3, 3, 1]
+    assert pa.Table.from_batches(batches).column("a").to_pylist() == list(range(10))
 
-    # Test that reader produces chunks
-    chunks = list(reader)
-    assert len(chunks) == 4  # 10 rows / 3 per chunk = 4 chunks
-    assert chunks[0].shape[0] == 3
-    assert chunks[3].shape[0] == 1  # Last chunk has remaining row
+
+def test_autotune_chunk_size():
+    """Test automatic chunk sizing from a schema."""
+    # 4 x int64 = 32 bytes per row -> 8192 rows in 256 KB
+    schema = pa.schema([(f"c{i}", pa.int64()) for i in range(4)])
+    assert _autotune_chunk_size(schema) == 8192
+
+    # Very wide rows are clamped to the minimum, tiny rows to the maximum
+    wide = pa.schema([(f"c{i}", pa.string()) for i in range(1000)])
+    assert _autotune_chunk_size(wide) == 1024
+    flags = pa.schema([("flag", pa.bool_())])
+    assert _autotune_chunk_size(flags, target_bytes=8 << 20) == 2**20
 
 
 def test_create_chunked_reader_unsupported():
@@ -128,80 +194,140 @@ def test_create_chunked_reader_unsupported():
         _create_chunked_reader("dummy.parquet", "parquet", 1000, None)
 
 
-def test_write_chunk_csv(tmp_path):
-    """Test writing CSV chunks.
-
-    Args:
-        tmp_path: Pytest fixture providing temporary directory
-    """
+def test_write_chunk_csv():
+    """Test writing CSV chunks."""
     chunk1 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
     chunk2 = pd.DataFrame({"a": [3, 4], "b": ["z", "w"]})
-    output_file = tmp_path / "output.csv"
-
-    # Write first chunk
-    _write_chunk_csv(chunk1, str(output_file), first=True)
+    output = io.BytesIO()
 
-    # Write second chunk
-    _write_chunk_csv(chunk2, str(output_file), first=False)
+    schema = _resolve_chunk_schema(chunk1)
+    csvwriter = _open_chunk_writer(output, "csv", schema)
+    _write_chunk_csv(chunk1, csvwriter, schema)
+    _write_chunk_csv(chunk2, csvwriter, schema)
+    csvwriter.close()
 
     # Verify result
-    result = pd.read_csv(output_file)
     expected = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "z", "w"]})
-    pd.testing.assert_frame_equal(result, expected)
+    assert_roundtrip_equal(output, expected, "csv")
 
 
-def test_write_chunk_parquet(tmp_path):
-    """Test writing Parquet chunks.
+def test_from_pandas_nthreads(monkeypatch):
+    """Test the from_pandas thread count heuristic.
 
     Args:
-        tmp_path: Pytest fixture providing temporary directory
+        monkeypatch: Pytest fixture for patching os.cpu_count
     """
-    chunk1 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
-    chunk2 = pd.DataFrame({"a": [3, 4], "b": ["z", "w"]})
-    output_file = tmp_path / "output.parquet"
+    monkeypatch.setattr(services.os, "cpu_count", lambda: 4)
+    narrow = pd.DataFrame({"a": ["x"], "b": ["y"]})
+    numeric = pd.DataFrame({f"c{i}": [1.0] for i in range(8)})
+    wide = pd.DataFrame({f"c{i}": ["x"] for i in range(8)})
 
-    # Write first chunk
-    pqwriter = _write_chunk_parquet(chunk1, str(output_file), first=True, pqwriter=None)
+    assert _from_pandas_nthreads(narrow) == 1
+    assert _from_pandas_nthreads(numeric) == 1
+    assert _from_pandas_nthreads(wide) == 4
 
-    # Write second chunk
-    pqwriter = _write_chunk_parquet(
-        chunk2, str(output_file), first=False, pqwriter=pqwriter
-    )
 
-    # Close writer
+def test_write_chunk_parquet():
+    """Test writing Parquet chunks."""
+    chunk1 = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    chunk2 = pd.DataFrame({"a": [3, 4], "b": ["z", "w"]})
+    output = io.BytesIO()
+
+    schema = _resolve_chunk_schema(chunk1)
+    pqwriter = _open_chunk_writer(output, "parquet", schema, {"compression": "zstd"})
+    _write_chunk_parquet(chunk1, pqwriter, schema)
+    _write_chunk_parquet(chunk2, pqwriter, schema)
     pqwriter.close()
 
     # Verify result
-    result = pd.read_parquet(output_file)
     expected = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "z", "w"]})
-    pd.testing.assert_frame_equal(result, expected)
+    assert_roundtrip_equal(output, expected, "parquet")
 
 
-def test_build_read_kwargs():
-    """Test building read kwargs for different formats."""
-    # Test CSV format
-    kwargs = _build_read_kwargs("csv", None, None)
-    assert kwargs["dtype_backend"] == "pyarrow"
-    assert kwargs["sep"] == ","
+def test_write_chunk_parquet_fixed_schema():
+    """Test that later chunks are cast to the schema of the first chunk."""
+    chunk1 = pd.DataFrame({"a": [1.0, 2.0]})
+    chunk2 = pd.DataFrame({"a": [3, 4]})  # int64 in pandas, double in schema
+    output = io.BytesIO()
 
-    # Test TSV format
-    kwargs = _build_read_kwargs("tsv", None, None)
-    assert kwargs["sep"] == "\t"
+    schema = _resolve_chunk_schema(chunk1)
+    pqwriter = _open_chunk_writer(output, "parquet", schema)
+    _write_chunk_parquet(chunk1, pqwriter, schema)
+    _write_chunk_parquet(chunk2, pqwriter, schema)
+    pqwriter.close()
+
+    result = pd.read_parquet(output)
+    assert result["a"].tolist() == [1.0, 2.0, 3.0, 4.0]
 
-    # Test PSV format
-    kwargs = _build_read_kwargs("psv", None, None)
-    assert kwargs["sep"] == "|"
 
-    # Test Excel with sheet name
-    kwargs = _build_read_kwargs("excel", "Sheet1", None)
-    assert kwargs["sheet_name"] == "Sheet1"
+def test_open_chunk_writer_coalesces_row_groups():
+    """Test that small Parquet chunks are coalesced into one row group."""
+    output = io.BytesIO()
+    schema = pa.schema([("a", pa.int64())])
+    pqwriter = _open_chunk_writer(output, "parquet", schema)
+    for start in range(0, 100, 10):
+        pqwriter.write_batch(
+            pa.record_batch([pa.array(range(start, start + 10))], schema=schema)
+        )
+    pqwriter.close()
 
-    # Test HTML with table number
-    kwargs = _build_read_kwargs("html", None, 2)
-    assert kwargs["match"] is None
-    assert kwargs["flavor"] == "bs4"
-    assert kwargs["header"] == 0
-    assert kwargs["index_col"] is None
+    metadata = pq.ParquetFile(output).metadata
+    assert metadata.num_row_groups == 1
+    assert metadata.num_rows == 100
+
+
+def test_open_chunk_writer_caps_chunks_per_row_group():
+    """Test that max_chunks bounds the chunks buffered for one row group."""
+    output = io.BytesIO()
+    schema = pa.schema([("a", pa.int64())])
+    pqwriter = _open_chunk_writer(output, "parquet", schema, max_chunks=4)
+    for start in range(0, 100, 10):
+        pqwriter.write_batch(
+            pa.record_batch([pa.array(range(start, start + 10))], schema=schema)
+        )
+    pqwriter.close()
+
+    metadata = pq.ParquetFile(output).metadata
+    assert [metadata.row_group(i).num_rows for i in range(3)] == [40, 40, 20]
+    assert metadata.num_row_groups == 3
+
+
+def test_parquet_row_group_size():
+    """Test row group sizing from the average row width."""
+    assert (
+        _parquet_row_group_size(1000, 1000) == services.PARQUET_ROW_GROUP_TARGET_BYTES
+    )
+    assert _parquet_row_group_size(10, 10 << 30) == services.PARQUET_MIN_ROW_GROUP_SIZE
+    assert _parquet_row_group_size(0, 0) > 0
+
+
+@pytest.mark.parametrize(
+    "fmt,sheet_name,table_number,expected",
+    [
+        ("csv", None, None, {"dtype_backend": "pyarrow", "sep": ","}),
+        ("tsv", None, None, {"sep": "\t"}),
+        ("psv", None, None, {"sep": "|"}),
+        ("excel", "Sheet1", None, {"sheet_name": "Sheet1"}),
+        (
+            "html",
+            None,
+            2,
+            {"match": None, "flavor": "bs4", "header": 0, "index_col": None},
+        ),
+    ],
+    ids=["csv", "tsv", "psv", "excel", "html"],
+)
+def test_build_read_kwargs(fmt, sheet_name, table_number, expected):
+    """Test building read kwargs for different formats.
+
+    Args:
+        fmt: The input format
+        sheet_name: Sheet name passed to _build_read_kwargs
+        table_number: Table number passed to _build_read_kwargs
+        expected: Entries the kwargs must contain
+    """
+    kwargs = _build_read_kwargs(fmt, sheet_name, table_number)
+    assert expected.items() <= kwargs.items()
 
 
 def test_build_read_kwargs_fixed_not_implemented():
@@ -212,36 +338,162 @@ def test_build_read_kwargs_fixed_not_implemented():
         _build_read_kwargs("fixed", None, None)
 
 
-def test_read_dataframe_csv(tmp_path):
+def test_read_dataframe_csv(tiny_files, tiny_df):
     """Test reading CSV dataframe.
 
     Args:
-        tmp_path: Pytest fixture providing temporary directory
+        tiny_files: Session directory with the tiny frame in each format
+        tiny_df: Session fixture with the tiny dataframe
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / "input.csv"
-    df.to_csv(input_file, index=False)
+    input_file = tiny_files / "input.csv"
 
     read_kwargs = {"dtype_backend": "pyarrow"}
     result = _read_dataframe(str(input_file), "csv", read_kwargs, None, None)
 
-    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+    assert_arrow_equal(tiny_df, result)
 
 
-def test_read_dataframe_parquet(tmp_path):
+def test_read_dataframe_parquet(tiny_files, tiny_df):
     """Test reading Parquet dataframe.
 
     Args:
-        tmp_path: Pytest fixture providing temporary directory
+        tiny_files: Session directory with the tiny frame in each format
+        tiny_df: Session fixture with the tiny dataframe
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / "input.parquet"
-    df.to_parquet(input_file, index=False)
+    input_file = tiny_files / "input.parquet"
 
     read_kwargs = {"dtype_backend": "pyarrow"}
     result = _read_dataframe(str(input_file), "parquet", read_kwargs, None, None)
 
-    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+    assert_arrow_equal(tiny_df, result)
+
+
+def test_read_arrow_table_csv(tmp_path):
+    """Test reading delimited text straight into an Arrow table.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", None, "z"]})
+    input_file = tmp_path / "input.psv"
+    df.to_csv(input_file, sep="|", index=False)
+
+    table = _read_arrow_table(str(input_file), "psv")
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["a", "b"]
+    assert table.column("b").to_pylist() == ["x", None, "z"]
+
+
+def test_read_arrow_table_csv_nrows(tmp_path):
+    """Test that nrows limits the rows read from delimited text.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": range(100)})
+    input_file = tmp_path / "input.csv"
+    df.to_csv(input_file, index=False)
+
+    table = _read_arrow_table(str(input_file), "csv", nrows=10)
+
+    assert table.num_rows == 10
+    assert table.column("a").to_pylist() == list(range(10))
+
+
+def test_prefetch_chunks():
+    """Test that prefetched chunks keep their order."""
+    assert list(_prefetch_chunks(iter(range(10)), depth=2)) == list(range(10))
+
+
+def test_prefetch_chunks_propagates_errors():
+    """Test that reader errors are re-raised in the consumer."""
+
+    def reader():
+        yield 1
+        raise ValueError("bad chunk")
+
+    chunks = _prefetch_chunks(reader())
+    assert next(chunks) == 1
+    with pytest.raises(ValueError, match="bad chunk"):
+        next(chunks)
+
+
+def test_open_input_compressed(tmp_path):
+    """Test that compressed inputs are decompressed by extension.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    input_file = tmp_path / "input.csv.gz"
+    pd.DataFrame({"a": [1, 2]}).to_csv(input_file, index=False)
+
+    with _open_input(str(input_file)) as source:
+        assert source.read() == b"a\n1\n2\n"
+
+
+def test_arrow_to_pandas():
+    """Test converting a table to an Arrow-backed dataframe."""
+    table = pa.table({"a": [1, 2], "b": ["x", None]})
+
+    df = _arrow_to_pandas(table)
+
+    assert df["a"].tolist() == [1, 2]
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def test_window_batches():
+    """Test slicing a row window out of a record batch stream."""
+    batches = [
+        pa.record_batch([pa.array(range(i, i + 4))], names=["a"]) for i in (0, 4, 8)
+    ]
+
+    window = list(_window_batches(iter(batches), 3, 9))
+
+    assert [len(batch) for batch in window] == [1, 4, 1]
+    assert pa.Table.from_batches(window).column("a").to_pylist() == list(range(3, 9))
+    assert list(_window_batches(iter(batches), 5, 2)) == []
+
+
+def test_read_arrow_table_skip_rows(tmp_path):
+    """Test skipping leading rows of delimited text and Parquet inputs.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    csv_file = tmp_path / "input.csv"
+    parquet_file = tmp_path / "input.parquet"
+    pd.DataFrame({"a": range(100)}).to_csv(csv_file, index=False)
+    pq.write_table(pa.table({"a": range(100)}), parquet_file, row_group_size=10)
+
+    for input_file, fmt in [(csv_file, "csv"), (parquet_file, "parquet")]:
+        table = _read_arrow_table(str(input_file), fmt, nrows=10, skip_rows=35)
+        assert table.column("a").to_pylist() == list(range(35, 45))
+        assert _read_arrow_table(str(input_file), fmt, skip_rows=200).num_rows == 0
+
+
+def test_pushdown_rows():
+    """Test splitting row windows into pushed-down and residual parts."""
+    assert _pushdown_rows(None) == (0, None, None)
+    assert _pushdown_rows((10, 15)) == (10, 5, None)
+    assert _pushdown_rows((10, 5)) == (10, 0, None)
+    assert _pushdown_rows((-3, 20)) == (0, None, (-3, 20))
+
+
+def test_read_arrow_table_parquet_projection(tmp_path):
+    """Test column projection and nrows on the Parquet dataset scan.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+    """
+    df = pd.DataFrame({"a": range(100), "b": range(100), "c": range(100)})
+    input_file = tmp_path / "input.parquet"
+    df.to_parquet(input_file)
+
+    table = _read_arrow_table(str(input_file), "parquet", nrows=5, columns=["c", "a"])
+
+    assert table.column_names == ["c", "a"]
+    assert table.column("a").to_pylist() == list(range(5))
 
 
 def test_read_dataframe_unsupported_format(tmp_path):
@@ -259,163 +511,199 @@ def test_read_dataframe_unsupported_format(tmp_path):
         _read_dataframe(str(input_file), "unsupported", read_kwargs, None, None)
 
 
-def test_apply_row_selection_valid():
-    """Test valid row selection."""
-    df = pd.DataFrame({"a": range(10), "b": [f"row_{i}" for i in range(10)]})
-
-    # Test valid selection
-    result = _apply_row_selection(df, "2:5")
-    assert result.shape[0] == 3
-    assert result["a"].tolist() == [2, 3, 4]
+@pytest.fixture(scope="module")
+def rowsel_df():
+    """Ten-row frame shared by the row selection cases.
 
+    Returns:
+        The dataframe
+    """
+    return pd.DataFrame({"a": range(10), "b": [f"row_{i}" for i in range(10)]})
+
+
+@pytest.mark.parametrize(
+    "rows,expected",
+    [
+        ("2:5", [2, 3, 4]),
+        (None, list(range(10))),
+        ("invalid", list(range(10))),  # invalid format returns the input
+        ("10:20", []),
+    ],
+    ids=["valid", "none", "invalid", "out_of_bounds"],
+)
+def test_apply_row_selection(rowsel_df, rows, expected):
+    """Test row selection on a pandas dataframe.
 
-def test_apply_row_selection_none():
-    """Test row selection with None (no selection)."""
-    df = pd.DataFrame({"a": range(5)})
+    Args:
+        rowsel_df: Module fixture with the ten-row dataframe
+        rows: Row selection passed to _apply_row_selection
+        expected: Values of column "a" expected in the result
+    """
+    result = _apply_row_selection(rowsel_df, rows)
+    assert result.shape[0] == len(expected)
+    assert result["a"].tolist() == expected
+    if rows is None or rows == "invalid":
+        assert result is rowsel_df
 
-    result = _apply_row_selection(df, None)
-    pd.testing.assert_frame_equal(result, df)
 
+def test_apply_row_selection_arrow_table():
+    """Test row selection on a pyarrow Table."""
+    table = pa.table({"a": range(10)})
 
-def test_apply_row_selection_invalid():
-    """Test invalid row selection handling."""
-    df = pd.DataFrame({"a": range(5)})
+    assert _apply_row_selection(table, "2:5").column("a").to_pylist() == [2, 3, 4]
+    assert _apply_row_selection(table, "-2:10").column("a").to_pylist() == [8, 9]
+    assert _apply_row_selection(table, "10:20").num_rows == 0
 
-    # Test invalid format - should return original dataframe
-    result = _apply_row_selection(df, "invalid")
-    pd.testing.assert_frame_equal(result, df)
 
+def test_convert_dtypes(tiny_df):
+    """Test dtype conversion to pyarrow.
 
-def test_apply_row_selection_out_of_bounds():
-    """Test row selection with out-of-bounds indices."""
-    df = pd.DataFrame({"a": range(5)})
+    Args:
+        tiny_df: Session fixture with the tiny dataframe
+    """
+    result = _convert_dtypes(tiny_df)
 
-    # Test out-of-bounds selection
-    result = _apply_row_selection(df, "10:20")
-    assert result.shape[0] == 0
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert not isinstance(tiny_df["a"].dtype, pd.ArrowDtype)
 
 
-def test_convert_dtypes():
-    """Test dtype conversion to pyarrow."""
-    df = pd.DataFrame(
-        {"int_col": [1, 2, 3], "str_col": ["a", "b", "c"], "float_col": [1.1, 2.2, 3.3]}
-    )
+def test_convert_dtypes_skips_arrow_frames():
+    """Test that Arrow-backed frames are not converted again."""
+    df = pd.DataFrame({"a": [1, 2, 3]}).convert_dtypes(dtype_backend="pyarrow")
+    assert _convert_dtypes(df) is df
 
+    df["b"] = ["x", "y", "z"]
     result = _convert_dtypes(df)
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in result.dtypes)
+    assert not isinstance(df["b"].dtype, pd.ArrowDtype)
+
+
+@pytest.mark.parametrize(
+    "compression,compression_level,sheet_name,fmt,expected",
+    [
+        ("gzip", 6, None, "csv", {"compression": "gzip", "compression_level": 6}),
+        (None, None, "Sheet1", "excel", {"sheet_name": "Sheet1"}),
+        (None, None, None, "csv", {}),
+    ],
+    ids=["compression", "sheet_name", "defaults"],
+)
+def test_build_write_kwargs(compression, compression_level, sheet_name, fmt, expected):
+    """Test building write kwargs.
 
-    # Check that dtypes are converted to pyarrow
-    assert hasattr(result, "convert_dtypes")
-    # The actual conversion depends on pandas version and pyarrow availability
-
-
-def test_build_write_kwargs():
-    """Test building write kwargs."""
-    kwargs = _build_write_kwargs("gzip", 6, None, "csv")
-    assert kwargs["compression"] == "gzip"
-    assert kwargs["compression_level"] == 6
-    assert "sheet_name" not in kwargs
-
-    kwargs = _build_write_kwargs(None, None, "Sheet1", "excel")
-    assert kwargs["sheet_name"] == "Sheet1"
-    assert "compression" not in kwargs
-
-    kwargs = _build_write_kwargs(None, None, None, "csv")
-    assert kwargs == {}
+    Args:
+        compression: Compression passed to _build_write_kwargs
+        compression_level: Compression level passed to _build_write_kwargs
+        sheet_name: Sheet name passed to _build_write_kwargs
+        fmt: The output format
+        expected: The exact kwargs expected
+    """
+    kwargs = _build_write_kwargs(compression, compression_level, sheet_name, fmt)
+    assert kwargs == expected
 
 
-def test_write_dataframe_csv(tmp_path):
+def test_write_dataframe_csv(tmp_path, tiny_df):
     """Test writing CSV dataframe.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
     output_file = tmp_path / "output.csv"
     write_kwargs = {}
 
-    _write_dataframe(df, str(output_file), "csv", write_kwargs)
+    _write_dataframe(tiny_df, str(output_file), "csv", write_kwargs)
 
     # Verify result
-    result = pd.read_csv(output_file)
-    pd.testing.assert_frame_equal(result, df)
+    assert_roundtrip_equal(output_file, tiny_df, "csv")
 
 
-def test_write_dataframe_parquet(tmp_path):
-    """Test writing Parquet dataframe.
+def test_write_dataframe_csv_compressed_and_mixed(tmp_path):
+    """Test CSV output through Arrow codecs and the pandas fallbacks.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    output_file = tmp_path / "output.parquet"
-    write_kwargs = {}
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x, y", "y", None]})
+    gz_file = tmp_path / "output.csv.gz"
+    _write_dataframe(df, str(gz_file), "csv", {})
+    assert_arrow_equal(df, pd.read_csv(gz_file, compression="gzip"))
 
-    _write_dataframe(df, str(output_file), "parquet", write_kwargs)
+    xz_file = tmp_path / "output.csv.xz"
+    _write_dataframe(df, str(xz_file), "csv", {})
+    assert_arrow_equal(df, pd.read_csv(xz_file))
 
-    # Verify result
-    result = pd.read_parquet(output_file)
-    pd.testing.assert_frame_equal(result, df)
+    mixed = pd.DataFrame({"a": [1, "two", 3.5]})
+    mixed_file = tmp_path / "mixed.csv"
+    _write_dataframe(mixed, str(mixed_file), "csv", {})
+    assert mixed_file.read_text().splitlines() == ["a", "1", "two", "3.5"]
 
 
-def test_write_dataframe_unsupported_format(tmp_path):
-    """Test error handling for unsupported output formats.
+def test_write_dataframe_parquet(tmp_path, tiny_df):
+    """Test writing Parquet dataframe.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        tiny_df: Session fixture with the tiny dataframe
     """
-    df = pd.DataFrame({"a": [1, 2, 3]})
-    output_file = tmp_path / "output.unsupported"
+    output_file = tmp_path / "output.parquet"
     write_kwargs = {}
 
-    with pytest.raises(ValueError, match="Unsupported output format"):
-        _write_dataframe(df, str(output_file), "unsupported", write_kwargs)
+    _write_dataframe(tiny_df, str(output_file), "parquet", write_kwargs)
+
+    # Verify result
+    assert_roundtrip_equal(output_file, tiny_df, "parquet")
 
 
-def test_get_schema_from_arrow_format_parquet(tmp_path):
-    """Test getting schema from Parquet file.
+def test_write_dataframe_feather_sliced(tmp_path):
+    """Test writing a sliced (non-default index) dataframe as Feather.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / "input.parquet"
-    df.to_parquet(input_file, index=False)
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}).iloc[1:]
+    output_file = tmp_path / "output.feather"
 
-    schema = _get_schema_from_arrow_format(str(input_file), "parquet")
+    _write_dataframe(df, str(output_file), "feather", {"compression": "zstd"})
 
-    assert isinstance(schema, pa.Schema)
-    assert len(schema) == 2
-    assert schema.field(0).name == "a"
-    assert schema.field(1).name == "b"
+    assert_arrow_equal(df, pd.read_feather(output_file))
 
 
-def test_get_schema_from_arrow_format_feather(tmp_path):
-    """Test getting schema from Feather file.
+def test_write_dataframe_unsupported_format(tmp_path):
+    """Test error handling for unsupported output formats.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / "input.feather"
-    df.to_feather(input_file)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    output_file = tmp_path / "output.unsupported"
+    write_kwargs = {}
 
-    schema = _get_schema_from_arrow_format(str(input_file), "feather")
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        _write_dataframe(df, str(output_file), "unsupported", write_kwargs)
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "feather", "orc"])
+def test_get_schema_from_arrow_format(tiny_files, fmt):
+    """Test getting schema from Parquet, Feather and ORC files.
+
+    Args:
+        tiny_files: Session directory with the tiny frame in each format
+        fmt: The Arrow-native input format
+    """
+    schema = _get_schema_from_arrow_format(str(tiny_files / f"input.{fmt}"), fmt)
 
     assert isinstance(schema, pa.Schema)
-    assert len(schema) == 2
-    assert schema.field(0).name == "a"
-    assert schema.field(1).name == "b"
+    assert schema.names == ["a", "b"]
+    assert schema.field("a").type == pa.int64()
 
 
-def test_get_schema_from_pandas_format(tmp_path):
+def test_get_schema_from_pandas_format(tiny_files):
     """Test getting schema from pandas-based format.
 
     Args:
-        tmp_path: Pytest fixture providing temporary directory
+        tiny_files: Session directory with the tiny frame in each format
     """
-    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
-    input_file = tmp_path / "input.csv"
-    df.to_csv(input_file, index=False)
+    input_file = tiny_files / "input.csv"
 
     read_kwargs = {"dtype_backend": "pyarrow"}
     schema = _get_schema_from_pandas_format(
@@ -428,21 +716,18 @@ def test_get_schema_from_pandas_format(tmp_path):
     assert schema.field(1).name == "b"
 
 
-def test_export_schema_to_json(tmp_path):
+def test_export_schema_to_json(tmp_path, two_field_schema):
     """Test exporting schema to JSON file.
 
     Args:
         tmp_path: Pytest fixture providing temporary directory
+        two_field_schema: Session fixture with a two-field schema
     """
-    # Create a simple schema
-    schema = pa.schema([pa.field("a", pa.int64()), pa.field("b", pa.string())])
-
     output_file = tmp_path / "schema.json"
-    _export_schema_to_json(schema, str(output_file))
+    _export_schema_to_json(two_field_schema, str(output_file))
 
     # Verify JSON structure
-    with open(output_file, "r") as f:
-        schema_data = json.load(f)
+    schema_data = read_json(output_file)
 
     assert "fields" in schema_data
     assert len(schema_data["fields"]) == 2
@@ -454,3 +739,40 @@ def test_export_schema_to_json(tmp_path):
     field_types = [f["type"] for f in schema_data["fields"]]
     assert "int64" in field_types
     assert "string" in field_types
+
+
+def test_schema_json_roundtrip_without_orjson(tmp_path, monkeypatch, two_field_schema):
+    """Test schema export and load with the stdlib json fallback.
+
+    Args:
+        tmp_path: Pytest fixture providing temporary directory
+        monkeypatch: Pytest fixture for patching module attributes
+        two_field_schema: Session fixture with a two-field schema
+    """
+    monkeypatch.setattr(services, "orjson", None)
+
+    output_file = tmp_path / "schema.json"
+    _export_schema_to_json(two_field_schema, str(output_file))
+
+    assert _load_schema(str(output_file)) == two_field_schema
+
+
+def test_show_preview_bounds_columns(monkeypatch):
+    """Test that the preview renders missing values and at most 20 columns.
+
+    Args:
+        monkeypatch: Pytest fixture for patching the module console
+    """
+    output = io.StringIO()
+    monkeypatch.setattr(services, "console", Console(file=output, width=1000))
+    df = pd.DataFrame({f"col_{i}": [i, None] for i in range(30)}).convert_dtypes(
+        dtype_backend="pyarrow"
+    )
+
+    _show_preview(df)
+
+    rendered = output.getvalue()
+    assert "col_19" in rendered
+    assert "col_20" not in rendered
+    assert "<NA>" in rendered
+    assert "(first 20/30 columns)" in rendered
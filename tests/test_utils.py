@@ -5,184 +5,90 @@ This module contains tests for the utility functions in the daflip package,
 including format inference and other helper functions.
 """
 
-from src.daflip.utils import infer_format
+import pytest
 
+from src.daflip.utils import infer_format
 
-def test_infer_format():
+# (path, override, expected) cases for test_infer_format
+_CASES = (
+    # Extension detection for the supported formats
+    ("file.csv", None, "csv"),
+    ("file.tsv", None, "tsv"),
+    ("file.psv", None, "psv"),
+    ("file.parquet", None, "parquet"),
+    ("file.orc", None, "orc"),
+    ("file.feather", None, "feather"),
+    ("file.sas7bdat", None, "sas7bdat"),
+    ("file.dta", None, "dta"),
+    ("file.sav", None, "sav"),
+    ("file.xlsx", None, "xlsx"),
+    ("file.xls", None, "xls"),
+    ("file.html", None, "html"),
+    ("file.htm", None, "htm"),
+    # Extensions and overrides are case insensitive
+    ("file.CSV", None, "csv"),
+    ("file.Csv", None, "csv"),
+    ("file.PARQUET", None, "parquet"),
+    ("file.XLSX", None, "xlsx"),
+    ("file.txt", "CSV", "csv"),
+    ("file.txt", "Csv", "csv"),
+    # Override takes precedence over the extension
+    ("file.txt", "fixed", "fixed"),
+    ("file.csv", "parquet", "parquet"),
+    ("file.parquet", "csv", "csv"),
+    ("file.txt", "excel", "excel"),
+    ("file.unknown", "stata", "stata"),
+    ("archive.tar.gz", "csv", "csv"),
+    # An empty override falls back to the extension
+    ("file.csv", "", "csv"),
+    # Unknown extensions are returned as-is
+    ("file.unknown", None, "unknown"),
+    ("file.custom", None, "custom"),
+    ("file.data", None, "data"),
+    # Files without an extension
+    ("file", None, ""),
+    ("data", None, ""),
+    ("file", "csv", "csv"),
+    ("data", "parquet", "parquet"),
+    # Multiple dots and special characters
+    ("file.data.csv", None, "csv"),
+    ("my-file.csv", None, "csv"),
+    ("file_with_underscores.tsv", None, "tsv"),
+    ("file with spaces.parquet", None, "parquet"),
+    # Paths with directories
+    ("/path/to/file.csv", None, "csv"),
+    ("relative/path/data.parquet", None, "parquet"),
+    ("C:\\Windows\\Path\\file.xlsx", None, "xlsx"),
+    ("/path/to/file.txt", "csv", "csv"),
+    # Hidden files
+    (".hidden.csv", None, "csv"),
+    (".config.parquet", None, "parquet"),
+    (".hidden.txt", "csv", "csv"),
+)
+
+
+@pytest.mark.parametrize("path,override,expected", _CASES)
+def test_infer_format(path, override, expected):
     """Test the format inference functionality.
 
     This test verifies that the infer_format function correctly:
     - Extracts format from file extensions
-    - Handles format overrides
+    - Handles format overrides, which take precedence over the extension
     - Returns lowercase format strings
 
-    Test cases:
-    - CSV file extension detection
-    - TSV file extension detection
-    - Format override functionality
-    """
-    from src.daflip.utils import infer_format
-
-    assert infer_format("file.csv") == "csv"
-    assert infer_format("file.tsv") == "tsv"
-    assert infer_format("file.txt", override="fixed") == "fixed"
-
-
-def test_infer_format_edge_cases():
-    """Test format inference with edge cases.
-
-    This test covers various edge cases for format inference:
-    - Files without extensions
-    - Files with multiple dots
-    - Uppercase extensions
-    - Empty overrides
-    - Special characters in filenames
-    """
-    # Test files without extensions
-    assert infer_format("file", override="csv") == "csv"
-
-    # Test files with multiple dots
-    assert infer_format("file.data.csv") == "csv"
-    assert infer_format("archive.tar.gz", override="csv") == "csv"
-
-    # Test uppercase extensions
-    assert infer_format("file.CSV") == "csv"
-    assert infer_format("file.PARQUET") == "parquet"
-    assert infer_format("file.XLSX") == "xlsx"
-
-    # Test empty override
-    assert infer_format("file.csv", override="") == "csv"
-
-    # Test special characters in filenames
-    assert infer_format("my-file.csv") == "csv"
-    assert infer_format("file_with_underscores.tsv") == "tsv"
-    assert infer_format("file with spaces.parquet") == "parquet"
-
-
-def test_infer_format_override_precedence():
-    """Test that override takes precedence over file extension.
-
-    This test verifies that when an override is provided, it takes
-    precedence over the file extension, regardless of the extension.
-    """
-    # Override should take precedence
-    assert infer_format("file.csv", override="parquet") == "parquet"
-    assert infer_format("file.parquet", override="csv") == "csv"
-    assert infer_format("file.txt", override="excel") == "excel"
-    assert infer_format("file.unknown", override="stata") == "stata"
-
-
-def test_infer_format_case_insensitive():
-    """Test that format inference is case insensitive.
-
-    This test verifies that both file extensions and overrides
-    are handled case-insensitively.
-    """
-    # File extensions should be case insensitive
-    assert infer_format("file.CSV") == "csv"
-    assert infer_format("file.Csv") == "csv"
-    assert infer_format("file.csv") == "csv"
-
-    # Overrides should be case insensitive
-    assert infer_format("file.txt", override="CSV") == "csv"
-    assert infer_format("file.txt", override="Csv") == "csv"
-    assert infer_format("file.txt", override="csv") == "csv"
-
-
-def test_infer_format_common_extensions():
-    """Test format inference for all supported extensions.
-
-    This test verifies that all supported file extensions are
-    correctly identified.
+    Args:
+        path: File path to infer the format from
+        override: Format override passed to infer_format
+        expected: The expected format string
     """
-    # Test all supported input formats
-    assert infer_format("file.csv") == "csv"
-    assert infer_format("file.tsv") == "tsv"
-    assert infer_format("file.psv") == "psv"
-    assert infer_format("file.parquet") == "parquet"
-    assert infer_format("file.orc") == "orc"
-    assert infer_format("file.feather") == "feather"
-    assert infer_format("file.sas7bdat") == "sas7bdat"
-    assert infer_format("file.dta") == "dta"
-    assert infer_format("file.sav") == "sav"
-    assert infer_format("file.xlsx") == "xlsx"
-    assert infer_format("file.xls") == "xls"
-    assert infer_format("file.html") == "html"
-    assert infer_format("file.htm") == "htm"
+    result = infer_format(path, override=override)
+    assert isinstance(result, str)
+    assert result == expected
 
 
-def test_infer_format_unknown_extensions():
-    """Test format inference for unknown extensions.
-
-    This test verifies that unknown extensions are handled correctly
-    and return the extension as-is.
-    """
-    # Unknown extensions should return the extension
-    assert infer_format("file.unknown") == "unknown"
-    assert infer_format("file.custom") == "custom"
-    assert infer_format("file.data") == "data"
-
-    # But override should still work
-    assert infer_format("file.unknown", override="csv") == "csv"
-
-
-def test_infer_format_no_extension():
-    """Test format inference for files without extensions.
-
-    This test verifies that files without extensions are handled
-    correctly, returning empty string when no override is provided.
-    """
-    # Files without extensions should return empty string
-    assert infer_format("file") == ""
-    assert infer_format("data") == ""
-    assert infer_format("input") == ""
-
-    # But override should work
-    assert infer_format("file", override="csv") == "csv"
-    assert infer_format("data", override="parquet") == "parquet"
-
-
-def test_infer_format_path_with_directories():
-    """Test format inference with file paths containing directories.
-
-    This test verifies that format inference works correctly with
-    full file paths containing directories.
-    """
-    # Paths with directories should work
-    assert infer_format("/path/to/file.csv") == "csv"
-    assert infer_format("relative/path/data.parquet") == "parquet"
-    assert infer_format("C:\\Windows\\Path\\file.xlsx") == "xlsx"
-
-    # Override should still work with paths
-    assert infer_format("/path/to/file.txt", override="csv") == "csv"
-
-
-def test_infer_format_hidden_files():
-    """Test format inference with hidden files.
-
-    This test verifies that format inference works correctly with
-    hidden files (files starting with a dot).
-    """
-    # Hidden files should work
-    assert infer_format(".hidden.csv") == "csv"
-    assert infer_format(".config.parquet") == "parquet"
-
-    # Override should work with hidden files
-    assert infer_format(".hidden.txt", override="csv") == "csv"
-
-
-def test_infer_format_return_type():
-    """Test that infer_format returns the correct type.
-
-    This test verifies that the function always returns a string
-    and that the return value is always lowercase.
-    """
-    # Should always return string
-    assert isinstance(infer_format("file.csv"), str)
-    assert isinstance(infer_format("file", override="csv"), str)
-    assert isinstance(infer_format("file.unknown"), str)
-
-    # Should always return lowercase
-    assert infer_format("file.CSV") == "csv"
-    assert infer_format("file.PARQUET") == "parquet"
-    assert infer_format("file.txt", override="CSV") == "csv"
+def test_infer_format_cached():
+    """Test that repeated inference of the same path is served from cache."""
+    infer_format.cache_clear()
+    assert infer_format("cached.csv") == "csv"
+    assert infer_format("cached.csv") == "csv"
+    assert infer_format.cache_info().hits == 1